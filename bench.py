@@ -0,0 +1,221 @@
+"""Load test for one worker of main.py with fake ConversationRelay, LLM and Twilio.
+
+Starts the FastAPI app in-process, opens N sessions through /initiate-call, the
+/voice/* webhooks and both /ws/* websockets, then plays scripted prompts and
+reports turns/sec, time to first token, event-loop lag and memory per session.
+
+    python bench.py --sessions 50 --turns 10 --token-rate 40 --jitter 0.3
+"""
+import os
+import json
+import time
+import random
+import asyncio
+import logging
+import argparse
+import tracemalloc
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+import httpx
+
+import main
+
+PROMPTS = [
+    "Hello, can you hear me?",
+    "Yes, I can hear you fine.",
+    "I would like to book a table for two people tomorrow evening.",
+    "What time works best for you?",
+    "Around eight o'clock, if that is possible.",
+    "Thank you, see you then.",
+]
+
+class FakeLLM:
+    """Stand-in for litellm.acompletion that streams the prompt back word by word"""
+    def __init__(self, token_rate: float, jitter: float, ttft: float):
+        self.token_rate = token_rate
+        self.jitter = jitter
+        self.ttft = ttft
+        self.calls = 0
+
+    def _delay(self, base: float) -> float:
+        return max(0.0, base * (1 + random.uniform(-self.jitter, self.jitter)))
+
+    async def acompletion(self, messages: List[dict], **kwargs):
+        self.calls += 1
+        words = messages[-1]["content"].split()
+        if words and words[0].startswith("["):
+            words = words[1:]  # Language tag added by ConversationContext
+        await asyncio.sleep(self._delay(self.ttft))
+        return self._stream(words)
+
+    async def _stream(self, words: List[str]):
+        for word in words:
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=word + " "))])
+            await asyncio.sleep(self._delay(1 / self.token_rate))
+
+async def fake_twilio_call(**kwargs):
+    """Stand-in for create_twilio_call: the webhook is driven by the benchmark instead"""
+    return SimpleNamespace(sid=f"CA{random.getrandbits(64):016x}")
+
+async def fake_warm_llm_connections():
+    """Stand-in for warm_llm_connections: the fake LLM has no connections to open"""
+
+class FakeConversationRelay:
+    """One ConversationRelay websocket leg, spoken to through the ASGI interface"""
+    def __init__(self, path: str):
+        self.path = path
+        self.inbound: asyncio.Queue = asyncio.Queue()
+        self.outbound: asyncio.Queue = asyncio.Queue()
+        self.task: Optional[asyncio.Task] = None
+
+    async def connect(self):
+        scope = {
+            "type": "websocket", "path": self.path, "raw_path": self.path.encode(), "root_path": "",
+            "scheme": "wss", "query_string": b"", "headers": [(b"host", b"bench")],
+            "client": ("127.0.0.1", 0), "server": ("bench", 443), "subprotocols": [],
+        }
+        await self.inbound.put({"type": "websocket.connect"})
+        self.task = asyncio.create_task(main.app(scope, self.inbound.get, self._send))
+
+    async def _send(self, message: dict):
+        if message["type"] == "websocket.send":
+            await self.outbound.put(json.loads(message["text"]))
+        elif message["type"] == "websocket.close":
+            await self.outbound.put({"type": "closed"})
+
+    async def send(self, message: dict):
+        await self.inbound.put({"type": "websocket.receive", "text": json.dumps(message)})
+
+    async def receive_text_event(self) -> dict:
+        """Return the next text event, skipping play events"""
+        while True:
+            event = await self.outbound.get()
+            if event.get("type") in ("text", "closed"):
+                return event
+
+    async def disconnect(self):
+        await self.inbound.put({"type": "websocket.disconnect", "code": 1000})
+        if self.task:
+            await asyncio.gather(self.task, return_exceptions=True)
+
+class Results:
+    def __init__(self):
+        self.first_token: List[float] = []
+        self.turn_latency: List[float] = []
+        self.loop_lag: List[float] = []
+        self.turns = 0
+        self.errors = 0
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+async def monitor_loop_lag(results: Results, interval: float = 0.01):
+    """Measure how late the event loop wakes a sleeping task"""
+    while True:
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        results.loop_lag.append(time.perf_counter() - started - interval)
+
+async def open_session(client: httpx.AsyncClient, index: int):
+    form = {
+        "from_number": f"+1555{index:07d}",
+        "to_number": f"+4930{index:07d}",
+        "source_language": "en-US",
+        "target_language": "de-DE",
+    }
+    response = await client.post("/initiate-call", data=form)
+    response.raise_for_status()
+    session_id = response.json()["session_id"]
+
+    legs: Dict[str, FakeConversationRelay] = {}
+    for role in ("source", "target"):
+        twiml = await client.post(f"/voice/{role}/{session_id}", data={"CallSid": f"CA-{role}-{index}"})
+        assert "ConversationRelay" in twiml.text
+        leg = FakeConversationRelay(f"/ws/{role}/{session_id}")
+        await leg.connect()
+        await leg.send({"type": "setup", "callSid": f"CA-{role}-{index}"})
+        legs[role] = leg
+
+    # Both legs hear "You are ready to talk." once the second one joins
+    for leg in legs.values():
+        await leg.receive_text_event()
+    return legs
+
+async def run_turns(legs: Dict[str, FakeConversationRelay], turns: int, think_time: float, results: Results):
+    for number in range(turns):
+        speaker = "source" if number % 2 == 0 else "target"
+        listener = legs[main.peer_role(speaker)]
+        started = time.perf_counter()
+        await legs[speaker].send({"type": "prompt", "voicePrompt": random.choice(PROMPTS), "last": True})
+        try:
+            event = await asyncio.wait_for(listener.receive_text_event(), timeout=30)
+            results.first_token.append(time.perf_counter() - started)
+            while not event.get("last") and event.get("type") != "closed":
+                event = await asyncio.wait_for(listener.receive_text_event(), timeout=30)
+            results.turn_latency.append(time.perf_counter() - started)
+            results.turns += 1
+        except asyncio.TimeoutError:
+            results.errors += 1
+        await asyncio.sleep(think_time * random.uniform(0.5, 1.5))
+
+async def run_benchmark(args) -> Results:
+    fake_llm = FakeLLM(args.token_rate, args.jitter, args.ttft)
+    main.acompletion = fake_llm.acompletion
+    main.create_twilio_call = fake_twilio_call
+    main.warm_llm_connections = fake_warm_llm_connections
+    if args.disable_cache:
+        main.TRANSLATION_CACHE_MAX_CHARS = 0
+
+    results = Results()
+    # Run the app's startup hooks (relay, reaper, transcript writer, phrase warm) like a served worker
+    async with main.app.router.lifespan_context(main.app):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            tracemalloc.start()
+            baseline = tracemalloc.get_traced_memory()[0]
+            lag_task = asyncio.create_task(monitor_loop_lag(results))
+
+            all_legs = await asyncio.gather(*(open_session(client, index) for index in range(args.sessions)))
+            per_session = (tracemalloc.get_traced_memory()[0] - baseline) / max(1, args.sessions)
+
+            started = time.perf_counter()
+            await asyncio.gather(*(run_turns(legs, args.turns, args.think_time, results) for legs in all_legs))
+            elapsed = time.perf_counter() - started
+
+            lag_task.cancel()
+            for legs in all_legs:
+                await legs["source"].disconnect()
+                await legs["target"].disconnect()
+            tracemalloc.stop()
+
+    print(f"sessions:           {args.sessions}")
+    print(f"turns completed:    {results.turns} ({results.errors} timed out)")
+    print(f"turns/sec:          {results.turns / elapsed:.1f}")
+    print(f"first token p50/p99: {percentile(results.first_token, 50) * 1000:.1f} / {percentile(results.first_token, 99) * 1000:.1f} ms")
+    print(f"turn latency p50/p99: {percentile(results.turn_latency, 50) * 1000:.1f} / {percentile(results.turn_latency, 99) * 1000:.1f} ms")
+    print(f"loop lag p50/p99/max: {percentile(results.loop_lag, 50) * 1000:.2f} / {percentile(results.loop_lag, 99) * 1000:.2f} / {max(results.loop_lag, default=0) * 1000:.2f} ms")
+    print(f"memory per session: {per_session / 1024:.1f} KiB")
+    print(f"LLM calls:          {fake_llm.calls}")
+    return results
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=20, help="Concurrent translation sessions")
+    parser.add_argument("--turns", type=int, default=10, help="Prompts per session, alternating speakers")
+    parser.add_argument("--token-rate", type=float, default=50.0, help="Fake LLM tokens per second")
+    parser.add_argument("--ttft", type=float, default=0.25, help="Fake LLM time to first token in seconds")
+    parser.add_argument("--jitter", type=float, default=0.2, help="Relative random variation of fake LLM delays")
+    parser.add_argument("--think-time", type=float, default=0.2, help="Average pause between turns in seconds")
+    parser.add_argument("--disable-cache", action="store_true", help="Send every prompt to the fake LLM")
+    parser.add_argument("--seed", type=int, default=1)
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    random.seed(arguments.seed)
+    logging.getLogger().setLevel(os.getenv("BENCH_LOG_LEVEL", "WARNING"))
+    asyncio.run(run_benchmark(arguments))
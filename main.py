@@ -1,24 +1,141 @@
 import os
 import json
+import asyncio
+import inspect
+import re
+import gzip
+import heapq
+import resource
+import signal
+import sqlite3
+import tempfile
 import uvicorn
+import atexit
 import logging
-from typing import Dict, Optional
+import contextvars
+import copy
+import logging.handlers
+import queue
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
 from fastapi import FastAPI, WebSocket, Request
 from fastapi.responses import Response
-from openai import AsyncAzureOpenAI,AsyncOpenAI
 from dotenv import load_dotenv
 from twilio.rest import Client
-from fastapi.responses import HTMLResponse, FileResponse, RedirectResponse, JSONResponse
+from fastapi.responses import HTMLResponse, FileResponse, RedirectResponse, JSONResponse, PlainTextResponse
 import time
-from litellm import acompletion
-import litellm
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s.%(msecs)03d - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
+import functools
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+import httpx
+
+# Configure logging: records are queued on the event loop and written by a background thread
+LOG_LEVEL = getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO)
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text")  # "text" or "json" (one object per line)
+LOG_MESSAGE_RATE = int(os.getenv("LOG_MESSAGE_RATE", "5"))  # Per-message debug lines per second per session
+
+current_session_id: contextvars.ContextVar[str] = contextvars.ContextVar("current_session_id", default="")
+log_levels: Dict[str, int] = {"": LOG_LEVEL}  # Session id -> level; "" is the level for everything else
+
+class SessionLogFilter(logging.Filter):
+    """Tag records with the session being served and apply per-session levels.
+
+    Runs in the logging caller's thread, where the session context variable is set.
+    """
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.session_id = getattr(record, "session_id", "") or current_session_id.get()
+        record.session_tag = f"[{record.session_id}] " if record.session_id else ""
+        return record.levelno >= log_levels.get(record.session_id, log_levels[""])
+
+class JsonLogFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record, '%Y-%m-%dT%H:%M:%S') + f".{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if getattr(record, "session_id", ""):
+            entry["session_id"] = record.session_id
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves message interpolation and traceback formatting to the listener thread.
+
+    The stock prepare() formats the record on the caller's thread, which here is the
+    event loop; records only cross threads within this process, so a copy is enough.
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return copy.copy(record)
+
+def set_log_level(level: Optional[int], session_id: str = ""):
+    """Change the default level, or one session's level (None removes the override)"""
+    if level is None:
+        log_levels.pop(session_id, None)
+    else:
+        log_levels[session_id] = level
+    log_levels.setdefault("", LOG_LEVEL)
+    # The root logger gates record creation, so it follows the most verbose level in use
+    logging.getLogger().setLevel(min(log_levels.values()))
+
+def configure_logging() -> logging.handlers.QueueListener:
+    output = logging.StreamHandler()
+    if LOG_FORMAT == "json":
+        output.setFormatter(JsonLogFormatter())
+    else:
+        output.setFormatter(logging.Formatter('%(asctime)s.%(msecs)03d - %(levelname)s - %(session_tag)s%(message)s',
+                                              datefmt='%Y-%m-%d %H:%M:%S'))
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(SessionLogFilter())
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    set_log_level(LOG_LEVEL)
+    listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # Flush queued records on shutdown
+    return listener
+
+class MessageLog:
+    """Rate-limited logging for per-message debug lines.
+
+    Each session may emit LOG_MESSAGE_RATE lines per second; the rest are counted
+    and reported with the next line that gets through. Sessions with their own log
+    level are being debugged on purpose and are not limited.
+    """
+    def __init__(self, rate: int):
+        self.rate = rate
+        self.windows: Dict[str, List[int]] = {}  # Session id -> [second, lines, suppressed]
+
+    def debug(self, message: str, *args):
+        if not logging.getLogger().isEnabledFor(logging.DEBUG):
+            return
+        session_id = current_session_id.get()
+        if session_id not in log_levels:
+            second = int(time.monotonic())
+            window = self.windows.setdefault(session_id, [second, 0, 0])
+            if window[0] != second:
+                window[0], window[1] = second, 0
+            window[1] += 1
+            if window[1] > self.rate:
+                window[2] += 1
+                return
+            if window[2]:
+                message += f" ({window[2]} similar lines suppressed)"
+                window[2] = 0
+        logging.debug(message, *args)
+
+    def forget(self, session_id: str):
+        self.windows.pop(session_id, None)
+
+log_listener = configure_logging()
+message_log = MessageLog(LOG_MESSAGE_RATE)
 logging.getLogger('twilio').setLevel(logging.WARNING)
 
 os.environ["AZURE_API_KEY"] = "3T3EuIFcgBiqLGtRbSd9PywVHAKw2RsbnROSIdWCmhPdvkIPnfD0JQQJ99BDACHYHv6XJ3w3AAAAACOGONVI"
@@ -27,12 +144,119 @@ os.environ["AZURE_API_VERSION"] = "2024-12-01-preview"
 
 load_dotenv()
 app = FastAPI()
-openai_client = AsyncAzureOpenAI(api_key="3T3EuIFcgBiqLGtRbSd9PywVHAKw2RsbnROSIdWCmhPdvkIPnfD0JQQJ99BDACHYHv6XJ3w3AAAAACOGONVI",
-                                 azure_endpoint="https://ai-mateo5227ai919927469639.openai.azure.com/",
-                                 api_version="2024-12-01-preview")
 twilio_client = Client("AC50eb788caaafa637df08298a282828b3","fbbb000c351758317d7c666e80d29b86")
 music_url = "https://pub-09065925c50a4711a49096e7dbee29ce.r2.dev/ringtone-02-133354.mp3"
 wait_url = "https://pub-09065925c50a4711a49096e7dbee29ce.r2.dev/mixkit-marimba-ringtone-1359.wav"
+twilio_number = "+14432251592"
+
+# Twilio REST calls are blocking, so they run on a bounded thread pool instead of the event loop
+TWILIO_MAX_WORKERS = int(os.getenv("TWILIO_MAX_WORKERS", "16"))
+BULK_MAX_SESSIONS = int(os.getenv("BULK_MAX_SESSIONS", "100"))  # Sessions per /initiate-calls request
+twilio_executor = ThreadPoolExecutor(max_workers=TWILIO_MAX_WORKERS, thread_name_prefix="twilio")
+
+# Session store: "memory" (single worker) or "sqlite" (shared by every worker on the host)
+SESSION_STORE = os.getenv("SESSION_STORE", "memory")
+SESSION_STORE_PATH = os.getenv("SESSION_STORE_PATH", "sessions.db")
+RELAY_POLL_INTERVAL = float(os.getenv("RELAY_POLL_INTERVAL", "0.02"))  # Seconds between cross-worker relay polls
+RELAY_PURGE_INTERVAL = float(os.getenv("RELAY_PURGE_INTERVAL", "30"))  # Seconds between sweeps of undelivered relay messages
+WORKER_ID = f"{socket.gethostname()}-{os.getpid()}"
+
+# Coalesce LLM tokens into phrase-sized chunks before they reach TTS
+TOKEN_COALESCING = os.getenv("TOKEN_COALESCING", "true").lower() == "true"
+COALESCE_MAX_CHARS = int(os.getenv("COALESCE_MAX_CHARS", "80"))  # Flush once this much text is buffered
+COALESCE_MAX_DELAY = float(os.getenv("COALESCE_MAX_DELAY_MS", "200")) / 1000  # Flush buffered text after this long
+
+# LLM deployments used for translation. TRANSLATION_BACKENDS takes a JSON list of
+# {"name", "model", "api_base", "api_version", "api_key"} objects.
+DEFAULT_TRANSLATION_BACKENDS = [{
+    "name": "azure-gpt-4.1-nano",
+    "model": "azure/gpt-4.1-nano",
+    "api_base": "https://ai-mateo5227ai919927469639.openai.azure.com/",
+    "api_version": "2024-12-01-preview",
+    "api_key": "3T3EuIFcgBiqLGtRbSd9PywVHAKw2RsbnROSIdWCmhPdvkIPnfD0JQQJ99BDACHYHv6XJ3w3AAAAACOGONVI",
+}]
+TRANSLATION_BACKENDS = json.loads(os.getenv("TRANSLATION_BACKENDS", "null")) or DEFAULT_TRANSLATION_BACKENDS
+HEDGE_AFTER = float(os.getenv("HEDGE_AFTER_MS", "800")) / 1000  # Send a hedged request if no first token by then
+TTFT_SMOOTHING = 0.2  # Weight of the newest sample in each backend's rolling time to first token
+BREAKER_THRESHOLD = int(os.getenv("BREAKER_THRESHOLD", "3"))  # Consecutive errors before a backend is ejected
+BREAKER_COOLDOWN = float(os.getenv("BREAKER_COOLDOWN", "30"))  # Seconds an ejected backend is skipped
+LLM_HTTP2 = os.getenv("LLM_HTTP2", "true").lower() == "true"  # Multiplex LLM requests over HTTP/2
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "100"))  # Pooled connections to all backends
+LLM_KEEPALIVE = float(os.getenv("LLM_KEEPALIVE", "120"))  # Seconds an idle pooled connection stays open
+
+# Admission control for LLM calls. Budgets are per worker process: divide the
+# deployment quota by the gunicorn worker count.
+LLM_RPM = float(os.getenv("LLM_RPM", "1000"))  # Requests per minute
+LLM_TPM = float(os.getenv("LLM_TPM", "1000000"))  # Prompt + completion tokens per minute
+LLM_BURST_SECONDS = 10  # Bucket capacity in seconds of budget, matching Azure's 10-second rate windows
+SCHEDULER_AGING = float(os.getenv("SCHEDULER_AGING", "50"))  # Estimated tokens forgiven per second waited
+ADMISSION_MAX_QUEUE = int(os.getenv("ADMISSION_MAX_QUEUE", "50"))  # Waiting LLM calls before new sessions are refused
+ADMISSION_MAX_WAIT = float(os.getenv("ADMISSION_MAX_WAIT", "2.0"))  # Oldest wait (seconds) before new sessions are refused
+
+# Adaptive filler: played only when a listener is predicted to wait long for the first chunk
+FILLER_THRESHOLD = float(os.getenv("FILLER_THRESHOLD_MS", "1200")) / 1000  # Predicted wait before filler plays
+FILLER_MODE = os.getenv("FILLER_MODE", "audio")  # "audio" loops FILLER_AUDIO_URL, "phrase" speaks the hold phrase
+FILLER_AUDIO_URL = os.getenv("FILLER_AUDIO_URL", music_url)
+LATENCY_DECAY = 0.98  # Weight older turns keep per new observation in the wait prediction
+LATENCY_MIN_SAMPLES = 5  # Weighted turns before a language pair gets its own fit
+LATENCY_PRIOR_TTFT = 0.8  # Seconds assumed while no backend has a measured time to first token
+LATENCY_PRIOR_OVERHEAD = 0.3  # Seconds assumed on top of the first token before any turn is observed
+
+# Rolling conversation context sent with every turn of a session
+CONTEXT_TOKEN_BUDGET = int(os.getenv("CONTEXT_TOKEN_BUDGET", "1500"))  # History tokens before compaction
+CONTEXT_COMPACT_TO = int(os.getenv("CONTEXT_COMPACT_TO", "800"))  # History tokens kept after compaction
+
+# Session lifecycle deadlines (seconds); a session that overstays its state is torn down
+SESSION_STATES = ("dialing", "waiting", "active", "draining")
+SESSION_DEADLINES = {
+    "dialing": float(os.getenv("SESSION_DIAL_TIMEOUT", "60")),  # Until the first leg's websocket connects
+    "waiting": float(os.getenv("SESSION_PEER_TIMEOUT", "90")),  # Until the second leg joins
+    "active": float(os.getenv("SESSION_MAX_DURATION", "14400")),  # Longest conversation
+    "draining": float(os.getenv("SESSION_DRAIN_TIMEOUT", "15")),  # Until cleanup must have finished
+}
+# Transcripts, written off the live path by a background task
+TRANSCRIPT_DIR = os.getenv("TRANSCRIPT_DIR", "transcripts")  # One gzipped JSONL file per session; empty disables
+TRANSCRIPT_QUEUE_SIZE = int(os.getenv("TRANSCRIPT_QUEUE_SIZE", "10000"))  # Records waiting for the writer before drops
+TRANSCRIPT_BATCH_SIZE = 200  # Records written per batch
+TRANSCRIPT_FLUSH_INTERVAL = float(os.getenv("TRANSCRIPT_FLUSH_INTERVAL", "2.0"))  # Seconds a record may wait for its batch
+
+# Graceful drain: a worker sent SIGTERM refuses new sessions and exits once its calls end
+DRAIN_TIMEOUT = float(os.getenv("DRAIN_TIMEOUT", "300"))  # Seconds to wait for calls before ending them
+DRAIN_POLL_INTERVAL = 1.0  # Seconds between checks for remaining sessions
+
+FAILED_CALL_STATUSES = ("busy", "failed", "no-answer", "canceled", "completed")  # Twilio statuses that end a leg
+
+# Turn pipeline tuning (per session, per speaking direction)
+PROMPT_QUEUE_SIZE = int(os.getenv("PROMPT_QUEUE_SIZE", "4"))  # Prompts waiting for the translator
+MAX_TURNS_IN_FLIGHT = int(os.getenv("MAX_TURNS_IN_FLIGHT", "1"))  # Concurrent translations; extra turns supersede the oldest
+TURN_EVENT_QUEUE_SIZE = int(os.getenv("TURN_EVENT_QUEUE_SIZE", "32"))  # Buffered tokens before the LLM stream is paused
+
+# Speculative translation from partial transcripts (opt-in per session)
+SPECULATIVE_TRANSLATION = os.getenv("SPECULATIVE_TRANSLATION", "false").lower() == "true"  # Default for new sessions
+SPECULATION_MIN_CHARS = int(os.getenv("SPECULATION_MIN_CHARS", "12"))  # Shortest prefix worth translating early
+
+# Canned system phrases, pre-translated per language code
+PHRASE_CACHE_SIZE = int(os.getenv("PHRASE_CACHE_SIZE", "512"))  # (phrase, language) entries kept in memory
+PHRASE_CACHE_FILE = os.getenv("PHRASE_CACHE_FILE", "")  # Optional JSON file so restarts skip warming
+PHRASE_WARM_LANGUAGES = [lang for lang in os.getenv(
+    "PHRASE_WARM_LANGUAGES", "de-DE,es-ES,fr-FR,it-IT,ro-RO,pt-PT,el-GR,ja-JP,zh-CN,ar-SA").split(",") if lang]
+PHRASE_BASE_LANGUAGE = "en-US"  # Language the catalog is written in
+
+# Cross-session cache for short, frequently repeated utterances ("hello?", "yes", "thank you")
+TRANSLATION_CACHE_MAX_CHARS = int(os.getenv("TRANSLATION_CACHE_MAX_CHARS", "60"))  # Longer utterances are never cached
+TRANSLATION_CACHE_SIZE = int(os.getenv("TRANSLATION_CACHE_SIZE", "5000"))  # Max entries per worker
+TRANSLATION_CACHE_MAX_BYTES = int(os.getenv("TRANSLATION_CACHE_MAX_BYTES", str(2 * 1024 * 1024)))  # Max memory per worker
+TRANSLATION_CACHE_TTL = float(os.getenv("TRANSLATION_CACHE_TTL", "86400"))  # Seconds before an entry is retranslated
+TRANSLATION_CACHE_DB = os.getenv("TRANSLATION_CACHE_DB", "")  # Optional SQLite file shared by all gunicorn workers
+# Glossaries: terms translated a fixed way or kept verbatim
+GLOSSARY_FILE = os.getenv("GLOSSARY_FILE", "")  # JSON {term: null | rendering | {language: rendering}} for all sessions
+GLOSSARY_PROTECT_NUMBERS = os.getenv("GLOSSARY_PROTECT_NUMBERS", "true").lower() == "true"  # Keep digits verbatim
+
+SYSTEM_PHRASES = {
+    "ready": "You are ready to talk.",
+    "waiting": "Please wait while we connect the other participant.",
+    "hold": "One moment, please.",
+}
 
 # Session management for translation pairs
 # Translation session management
@@ -52,37 +276,1061 @@ class TranslationSession:
         self.target_tts_provider = "ElevenLabs"  # Default target TTS provider
         self.target_voice = ""  # Default target voice
         self.host = None  # Request host for WebSocket URLs
-        self.play_waiting_music = True  # Flag to control waiting music
+        self.play_waiting_music = True  # Cover long translation waits with filler
+        self.speculative_translation = SPECULATIVE_TRANSLATION  # Translate stable prefixes of partial prompts early
+        self.pipelines: Dict[str, "TurnPipeline"] = {}  # Turn pipeline per speaker ("source"/"target")
+        self.context = ConversationContext()  # Recent turns in both directions, sent as translation context
+        self.state = "dialing"  # Lifecycle state, one of SESSION_STATES
+        self.state_changed_at = time.time()  # Wall clock, so every worker can compute the deadline
+        self.glossary_entries: Dict[str, object] = {}  # Session glossary, merged over the global one
+        self.compiled_glossary: Optional["Glossary"] = None
+        self.answered: Dict[str, float] = {}  # Role -> wall clock time its call was picked up
+
+    def roles(self) -> Tuple[str, ...]:
+        """Every leg of the session"""
+        return ("source", "target")
+
+    def local_websocket(self, role: str) -> Optional[WebSocket]:
+        return self.source_websocket if role == "source" else self.target_websocket
+
+    def attach(self, role: str, websocket: Optional[WebSocket]):
+        setattr(self, f"{role}_websocket", websocket)
+
+    def call_sid_for(self, role: str) -> Optional[str]:
+        return getattr(self, f"{role}_call_sid")
+
+    def tts_provider_for(self, role: str) -> str:
+        return self.source_tts_provider if role == "source" else self.target_tts_provider
+
+    def websocket_for(self, role: str) -> Optional[WebSocket]:
+        """Return the websocket of the "source" or "target" leg, relayed if another worker holds it"""
+        return self.local_websocket(role) or translation_sessions.remote_websocket(self, role)
+
+    def languages_for(self, speaker: str) -> Tuple[str, str]:
+        """Return (spoken language, listener language) for an utterance from `speaker`"""
+        if speaker == "source":
+            return self.source_language, self.target_language
+        return self.target_language, self.source_language
+
+    def pipeline_for(self, speaker: str) -> "TurnPipeline":
+        """Return the turn pipeline for utterances from `speaker`, creating it on first use"""
+        if speaker not in self.pipelines:
+            self.pipelines[speaker] = TurnPipeline(self, speaker)
+        return self.pipelines[speaker]
+
+    def cancel_turns(self, speaker: str):
+        """Cancel `speaker`'s in-flight turns, on whichever worker runs their pipeline"""
+        if speaker in self.pipelines:
+            self.pipelines[speaker].cancel_in_flight()
+        else:
+            translation_sessions.relay_control(self, speaker, "cancel_turns")
+
+    def listener_speaking(self, listener: str):
+        """`listener`'s TTS started playing, so a turn translated for them reached their ear"""
+        self.turn_heard(peer_role(listener), listener)
+
+    def turn_heard(self, speaker: str, listener: str):
+        """Record `listener` hearing `speaker`'s oldest delivered turn, on whichever worker runs its pipeline"""
+        if speaker in self.pipelines:
+            self.pipelines[speaker].on_listener_speaking(listener)
+        else:
+            translation_sessions.relay_control(self, speaker, f"listener_speaking:{listener}")
+
+    async def stop_pipelines(self):
+        """Cancel in-flight turns and stop all pipeline stages"""
+        for pipeline in list(self.pipelines.values()):
+            await pipeline.stop()
+        self.pipelines.clear()
+
+    def glossary(self) -> "Glossary":
+        """The global glossary with this session's entries on top, compiled on first use"""
+        if self.compiled_glossary is None:
+            self.compiled_glossary = (Glossary({**global_glossary.entries, **self.glossary_entries})
+                                      if self.glossary_entries else global_glossary)
+        return self.compiled_glossary
+
+    def to_data(self) -> dict:
+        """Settings shared with other workers through the session store"""
+        return {field: getattr(self, field) for field in SESSION_FIELDS}
+
+    def update_from(self, data: dict):
+        """Take over settings another worker stored, keeping this worker's websockets and pipelines"""
+        if data.get("glossary_entries", self.glossary_entries) != self.glossary_entries:
+            self.compiled_glossary = None
+        for field in SESSION_FIELDS:
+            if field in data:  # Rows written before a field existed keep its default
+                setattr(self, field, data[field])
+
+def peer_role(role: str) -> str:
+    """Return the other leg of a two-party session"""
+    return "target" if role == "source" else "source"
+
+class ConferenceSession(TranslationSession):
+    """A session with any number of participants, each speaking their own language.
+
+    Every utterance goes through one ConferenceLane per distinct listener language,
+    so it is translated once per language rather than once per listener, and all
+    listeners sharing a language receive the same frames. Roles are participant ids.
+    """
+    def __init__(self, session_id: str):
+        super().__init__(session_id, "")
+        self.play_waiting_music = False
+        self.participants: Dict[str, dict] = {}  # Participant id -> phone number, language, TTS and call settings
+        self.websockets: Dict[str, WebSocket] = {}  # Participant id -> websocket held by this worker
+        self.contexts: Dict[str, ConversationContext] = {}  # Listener language -> conversation context
+        self.failed_websockets: set = set()  # Websockets that failed a send, skipped until they detach
+        self.greeted: set = set()  # Participants this worker has told "ready"
+
+    def add_participant(self, phone_number: str, language: str, tts_provider: str = "ElevenLabs", voice: str = "") -> str:
+        participant_id = f"p{len(self.participants) + 1}"
+        self.participants[participant_id] = {
+            "phone_number": phone_number, "language": language, "tts_provider": tts_provider,
+            "voice": voice, "call_sid": None, "call_status": None,
+        }
+        return participant_id
+
+    def roles(self) -> Tuple[str, ...]:
+        return tuple(self.participants)
+
+    def local_websocket(self, role: str) -> Optional[WebSocket]:
+        return self.websockets.get(role)
+
+    def attach(self, role: str, websocket: Optional[WebSocket]):
+        if websocket:
+            self.websockets[role] = websocket
+        else:
+            self.failed_websockets.discard(self.websockets.pop(role, None))
+
+    def call_sid_for(self, role: str) -> Optional[str]:
+        participant = self.participants[role]
+        return None if participant["call_status"] in FAILED_CALL_STATUSES else participant["call_sid"]
+
+    def tts_provider_for(self, role: str) -> str:
+        return self.participants[role]["tts_provider"]
+
+    def connected(self) -> List[str]:
+        """Participants whose websocket is up on any worker"""
+        return [participant_id for participant_id in self.participants if self.websocket_for(participant_id)]
+
+    def context_for(self, language: str) -> "ConversationContext":
+        if language not in self.contexts:
+            self.contexts[language] = ConversationContext(target_language=language)
+        return self.contexts[language]
+
+    def listener_group(self, speaker: str, language: str, skipped=()) -> Optional["ListenerGroup"]:
+        """Websockets of everyone but `speaker` and the `skipped` participants who listens in `language`"""
+        websockets = [self.websocket_for(participant_id) for participant_id, participant in self.participants.items()
+                      if participant_id != speaker and participant_id not in skipped and participant["language"] == language]
+        websockets = [websocket for websocket in websockets if websocket and websocket not in self.failed_websockets]
+        return ListenerGroup(websockets, self.failed_websockets) if websockets else None
+
+    def lanes_for(self, speaker: str) -> List["ConferenceLane"]:
+        """Return one lane per language currently spoken by the other participants"""
+        languages = sorted({self.participants[participant_id]["language"]
+                            for participant_id in self.connected() if participant_id != speaker})
+        lanes = []
+        for language in languages:
+            key = f"{speaker}>{language}"
+            if key not in self.pipelines:
+                self.pipelines[key] = ConferenceLane(self, speaker, language)
+            lanes.append(self.pipelines[key])
+        return lanes
+
+    def cancel_turns(self, speaker: str):
+        lanes = [lane for key, lane in self.pipelines.items() if key.startswith(f"{speaker}>")]
+        if lanes:
+            for lane in lanes:
+                lane.cancel_in_flight()
+        else:
+            translation_sessions.relay_control(self, speaker, "cancel_turns")
+
+    def cancel_turns_to(self, listener: str):
+        """Stop every other speaker's turns reaching `listener`, e.g. because they barged in"""
+        for speaker in self.participants:
+            if speaker == listener:
+                continue
+            if any(key.startswith(f"{speaker}>") for key in self.pipelines):
+                self.skip_listener(speaker, listener)
+            else:
+                translation_sessions.relay_control(self, speaker, f"skip_listener:{listener}")
+
+    def skip_listener(self, speaker: str, listener: str):
+        lane = self.pipelines.get(f"{speaker}>{self.participants[listener]['language']}")
+        if lane:
+            lane.skip_listener(listener)
+
+    def listener_speaking(self, listener: str):
+        # Any other speaker's lane into the listener's language may have sent what they hear
+        for speaker in self.participants:
+            if speaker != listener:
+                self.turn_heard(speaker, listener)
+
+    def turn_heard(self, speaker: str, listener: str):
+        if any(key.startswith(f"{speaker}>") for key in self.pipelines):
+            lane = self.pipelines.get(f"{speaker}>{self.participants[listener]['language']}")
+            if lane:
+                lane.on_listener_speaking(listener)
+        else:
+            translation_sessions.relay_control(self, speaker, f"listener_speaking:{listener}")
+
+    async def stop_lanes(self, speaker: str):
+        for key in [key for key in self.pipelines if key.startswith(f"{speaker}>")]:
+            await self.pipelines.pop(key).stop()
+
+    def to_data(self) -> dict:
+        return {**super().to_data(), "participants": self.participants}
+
+    def update_from(self, data: dict):
+        super().update_from(data)
+        self.participants = data.get("participants", self.participants)
+
+class ListenerGroup:
+    """Sends each frame to every listener of one language, serialized once.
+
+    A listener whose websocket fails is added to `failed` and skipped from then on,
+    so one dropped call does not end the utterance for the others; the send only
+    fails once no listener is left.
+    """
+    def __init__(self, websockets: List[WebSocket], failed: set):
+        self.websockets = websockets
+        self.failed = failed  # The session's websockets that failed a send
+
+    async def send_text(self, data: str):
+        websockets = [websocket for websocket in self.websockets if websocket not in self.failed]
+        results = await asyncio.gather(*(websocket.send_text(data) for websocket in websockets),
+                                       return_exceptions=True)
+        for websocket, result in zip(websockets, results):
+            if isinstance(result, Exception):
+                logging.warning(f"Dropping listener websocket after send error: {result}")
+                self.failed.add(websocket)
+        if all(websocket in self.failed for websocket in websockets):
+            raise ConnectionError("No listener websocket left")
+
+    async def send_json(self, data: dict):
+        await self.send_text(json.dumps(data))
+
+# Settings that describe a session; websockets and pipelines stay on the worker that owns them
+SESSION_FIELDS = (
+    "session_id", "source_call_sid", "target_call_sid", "source_phone_number", "target_phone_number",
+    "source_language", "target_language", "source_tts_provider", "source_voice", "target_tts_provider",
+    "target_voice", "host", "play_waiting_music", "speculative_translation", "state", "state_changed_at",
+    "glossary_entries", "answered",
+)
+
+def session_from_data(data: dict) -> TranslationSession:
+    """Rebuild a session from the settings another worker stored"""
+    if "participants" in data:
+        session = ConferenceSession(data["session_id"])
+    else:
+        session = TranslationSession(data["session_id"], data["source_call_sid"])
+    session.update_from(data)
+    return session
+
+class InMemorySessionStore:
+    """Session storage for a single worker process.
+
+    Other backends implement the same async interface plus websocket attachment
+    and relaying, so a Redis-backed store can replace SqliteSessionStore unchanged.
+    """
+    def __init__(self):
+        self.sessions: Dict[str, TranslationSession] = {}
+
+    async def get(self, session_id: str) -> Optional[TranslationSession]:
+        return self.sessions.get(session_id)
+
+    async def add(self, session: TranslationSession):
+        self.sessions[session.session_id] = session
+
+    async def pop(self, session_id: str) -> Optional[TranslationSession]:
+        return self.sessions.pop(session_id, None)
+
+    async def count(self) -> int:
+        """Sessions on every worker"""
+        return len(self.sessions)
+
+    def values(self) -> List[TranslationSession]:
+        """Sessions held by this worker"""
+        return list(self.sessions.values())
+
+    async def state_of(self, session_id: str) -> Optional[Tuple[str, float]]:
+        """(state, state_changed_at) of a session as every worker currently sees it"""
+        session = self.sessions.get(session_id)
+        return (session.state, session.state_changed_at) if session else None
+
+    async def save(self, session: TranslationSession, *fields: str):
+        """Publish changed session settings to other workers.
+
+        `fields` are dotted paths into `session.to_data()` ("state",
+        "participants.p1.call_status"); without them the whole session is written.
+        """
+
+    async def attach_websocket(self, session: TranslationSession, role: str, websocket: WebSocket):
+        session.attach(role, websocket)
+
+    async def detach_websocket(self, session: TranslationSession, role: str):
+        session.attach(role, None)
+
+    def remote_websocket(self, session: TranslationSession, role: str):
+        return None
+
+    def relay_control(self, session: TranslationSession, speaker: str, command: str):
+        pass
+
+    async def run_relay(self):
+        pass
+
+class RelayWebSocket:
+    """Stand-in for a websocket held by another worker; sends go through the store's relay"""
+    def __init__(self, store: "SqliteSessionStore", worker_id: str, session_id: str, role: str):
+        self.store = store
+        self.worker_id = worker_id
+        self.session_id = session_id
+        self.role = role
+
+    async def send_text(self, data: str):
+        self.store.relay(self.worker_id, self.session_id, self.role, data)
+
+    async def send_json(self, data: dict):
+        await self.send_text(json.dumps(data))
+
+    async def close(self):
+        await self.send_json({"__relay__": "close"})
+
+class SqliteSessionStore(InMemorySessionStore):
+    """Session settings in a SQLite file shared by every worker on the host.
+
+    Each worker keeps only the sessions whose websockets it holds in memory, and
+    refreshes them from the shared row on every lookup; other lookups build a fresh
+    copy from the row. Changes are written field by field, so workers updating
+    different settings of one session do not overwrite each other. Sends to a peer
+    websocket held by another worker are written to a relay table that the owning
+    worker polls and forwards in order.
+
+    Queries run one at a time on a thread of their own, in the order they were
+    made, so the event loop never waits on SQLite or on another worker's write lock.
+    """
+    def __init__(self, path: str):
+        super().__init__()
+        self.db = ThreadPoolExecutor(max_workers=1, thread_name_prefix="session-store")
+        self.conn = sqlite3.connect(path, timeout=5.0, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS sessions (session_id TEXT PRIMARY KEY, data TEXT)")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS websockets (session_id TEXT, role TEXT, worker TEXT, "
+                          "PRIMARY KEY (session_id, role))")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS relay (id INTEGER PRIMARY KEY AUTOINCREMENT, worker TEXT, "
+                          "session_id TEXT, role TEXT, payload TEXT, created_at REAL)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS relay_worker ON relay (worker, id)")
+        self.remote: Dict[Tuple[str, str], RelayWebSocket] = {}  # (session_id, role) -> leg held by another worker
+        self.outbox: List[tuple] = []  # Relay rows queued this loop iteration, written in one transaction
+        self.purged_at = 0.0  # When relay rows of dead workers were last deleted (database thread only)
+
+    async def _run(self, function, *args):
+        """Run `function(*args)` on the database thread"""
+        return await asyncio.get_running_loop().run_in_executor(self.db, function, *args)
+
+    def _query(self, sql: str, params: tuple = ()) -> list:
+        return self.conn.execute(sql, params).fetchall()
+
+    async def _execute(self, sql: str, params: tuple = ()) -> list:
+        return await self._run(self._query, sql, params)
+
+    def _load(self, session_id: str) -> Tuple[Optional[dict], Dict[str, str]]:
+        """The stored settings of a session and the worker holding each of its websockets"""
+        rows = self._query("SELECT data FROM sessions WHERE session_id = ?", (session_id,))
+        workers = dict(self._query("SELECT role, worker FROM websockets WHERE session_id = ?", (session_id,)))
+        return (json.loads(rows[0][0]) if rows else None), workers
+
+    def _track(self, session_id: str, workers: Dict[str, str]):
+        """Point relayed sends at the workers now holding the session's other legs"""
+        for key in [key for key in self.remote if key[0] == session_id and key[1] not in workers]:
+            del self.remote[key]
+        for role, worker_id in workers.items():
+            key = (session_id, role)
+            if worker_id == WORKER_ID:
+                self.remote.pop(key, None)
+            elif key not in self.remote or self.remote[key].worker_id != worker_id:
+                self.remote[key] = RelayWebSocket(self, worker_id, session_id, role)
+
+    async def get(self, session_id: str) -> Optional[TranslationSession]:
+        data, workers = await self._run(self._load, session_id)
+        session = self.sessions.get(session_id)
+        if session is None:
+            if data is None:
+                return None
+            session = session_from_data(data)
+        elif data is not None:
+            session.update_from(data)
+        # A session held here stays visible until this worker pops it, so its cleanup can still run
+        self._track(session_id, workers)
+        return session
+
+    async def add(self, session: TranslationSession):
+        await self.save(session)
+
+    async def state_of(self, session_id: str) -> Optional[Tuple[str, float]]:
+        # Read the shared row: another worker may have moved the session on since it was cached here
+        rows = await self._execute("SELECT json_extract(data, '$.state'), json_extract(data, '$.state_changed_at') "
+                                   "FROM sessions WHERE session_id = ?", (session_id,))
+        if rows:
+            return rows[0]
+        return await super().state_of(session_id)  # Removed by another worker but still held here
+
+    async def count(self) -> int:
+        return (await self._execute("SELECT COUNT(*) FROM sessions"))[0][0]
+
+    def _delete(self, session_id: str):
+        self.conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+        self.conn.execute("DELETE FROM websockets WHERE session_id = ?", (session_id,))
+
+    async def pop(self, session_id: str) -> Optional[TranslationSession]:
+        session = self.sessions.pop(session_id, None)
+        for key in [key for key in self.remote if key[0] == session_id]:
+            del self.remote[key]
+        await self._run(self._delete, session_id)
+        return session
+
+    async def save(self, session: TranslationSession, *fields: str):
+        data = session.to_data()
+        if not fields:
+            await self._execute("INSERT INTO sessions (session_id, data) VALUES (?, ?) "
+                                "ON CONFLICT(session_id) DO UPDATE SET data = excluded.data",
+                                (session.session_id, json.dumps(data)))
+            return
+        # Only the changed settings; an UPDATE also never brings back a session another worker removed
+        paths, params = [], []
+        for field in fields:
+            value = data
+            for key in field.split("."):
+                value = value[key]
+            paths.append("?, json(?)")
+            params += ["$" + "".join(f'."{key}"' for key in field.split(".")), json.dumps(value)]
+        await self._execute(f"UPDATE sessions SET data = json_set(data, {', '.join(paths)}) WHERE session_id = ?",
+                            (*params, session.session_id))
+
+    def _attach(self, session_id: str, role: str) -> Dict[str, str]:
+        self.conn.execute("INSERT OR REPLACE INTO websockets (session_id, role, worker) VALUES (?, ?, ?)",
+                          (session_id, role, WORKER_ID))
+        return dict(self._query("SELECT role, worker FROM websockets WHERE session_id = ?", (session_id,)))
+
+    async def attach_websocket(self, session: TranslationSession, role: str, websocket: WebSocket):
+        await super().attach_websocket(session, role, websocket)
+        self.sessions[session.session_id] = session
+        self._track(session.session_id, await self._run(self._attach, session.session_id, role))
+
+    async def detach_websocket(self, session: TranslationSession, role: str):
+        await super().detach_websocket(session, role)
+        if not any(session.local_websocket(other) for other in session.roles()):
+            self.sessions.pop(session.session_id, None)  # Nothing of it is held here any more
+        await self._execute("DELETE FROM websockets WHERE session_id = ? AND role = ? AND worker = ?",
+                            (session.session_id, role, WORKER_ID))
+
+    def remote_websocket(self, session: TranslationSession, role: str) -> Optional[RelayWebSocket]:
+        # Kept current by get() and attach_websocket(), so sends never wait on the database
+        return self.remote.get((session.session_id, role))
+
+    def relay(self, worker_id: str, session_id: str, role: str, payload: str):
+        """Queue a message for another worker; everything queued in one loop iteration is written together"""
+        if not self.outbox:
+            asyncio.get_running_loop().call_soon(self._flush_relay)
+        self.outbox.append((worker_id, session_id, role, payload, time.time()))
+
+    def _flush_relay(self):
+        rows, self.outbox = self.outbox, []
+        self.db.submit(self._insert_relayed, rows)
+
+    def _insert_relayed(self, rows: List[tuple]):
+        try:
+            self.conn.execute("BEGIN")
+            self.conn.executemany("INSERT INTO relay (worker, session_id, role, payload, created_at) "
+                                  "VALUES (?, ?, ?, ?, ?)", rows)
+            self.conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            if self.conn.in_transaction:
+                self.conn.execute("ROLLBACK")
+            logging.error(f"Session relay error, dropped {len(rows)} messages: {e}")
+
+    def relay_control(self, session: TranslationSession, speaker: str, command: str):
+        # A speaker's pipeline runs on the worker holding that speaker's websocket
+        remote = self.remote_websocket(session, speaker)
+        if remote:
+            self.relay(remote.worker_id, session.session_id, speaker, json.dumps({"__relay__": command}))
+
+    def _take_relayed(self) -> list:
+        rows = self._query("SELECT id, session_id, role, payload FROM relay WHERE worker = ? ORDER BY id",
+                           (WORKER_ID,))
+        if rows:
+            self.conn.execute("DELETE FROM relay WHERE worker = ? AND id <= ?", (WORKER_ID, rows[-1][0]))
+        if time.monotonic() - self.purged_at >= RELAY_PURGE_INTERVAL:
+            # Messages for workers that died are dropped after a minute
+            self.purged_at = time.monotonic()
+            self.conn.execute("DELETE FROM relay WHERE created_at < ?", (time.time() - 60,))
+        return rows
+
+    async def _deliver(self, session_id: str, role: str, payload: str):
+        session = self.sessions.get(session_id)
+        if not session:
+            return
+        command = json.loads(payload)["__relay__"] if payload.startswith('{"__relay__"') else None
+        if command == "cancel_turns":
+            session.cancel_turns(role)
+            return
+        if command and command.startswith("skip_listener:"):
+            session.skip_listener(role, command.split(":", 1)[1])
+            return
+        if command and command.startswith("listener_speaking:"):
+            session.turn_heard(role, command.split(":", 1)[1])
+            return
+        websocket = session.local_websocket(role)
+        if not websocket:
+            return
+        if command == "close":
+            await websocket.close()
+        else:
+            await websocket.send_text(payload)  # Already serialized by the sending worker
+
+    async def run_relay(self):
+        """Forward messages other workers sent to websockets held by this worker"""
+        while True:
+            try:
+                for _, session_id, role, payload in await self._run(self._take_relayed):
+                    await self._deliver(session_id, role, payload)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.error(f"Session relay error: {e}")
+            await asyncio.sleep(RELAY_POLL_INTERVAL)
 
 # Session storage
-translation_sessions: Dict[str, TranslationSession] = {}
-
-async def translate_text_streaming(text: str, source_lang: str = "en-US", target_lang: str = "de-DE"):
-    """Streaming translation function using OpenAI"""
-    messages = [
-        {"role": "system", "content": f"You are a professional real-time translator. Translate the following {source_lang} text to {target_lang}. Provide only the translation, no explanations or additional text."},
-        {"role": "user", "content": text}
-    ]
+if SESSION_STORE == "sqlite":
+    translation_sessions = SqliteSessionStore(SESSION_STORE_PATH)
+else:
+    translation_sessions = InMemorySessionStore()
+
+# Strong references to fire-and-forget tasks so they are not garbage collected
+background_tasks = set()
+
+def spawn_background(coro) -> asyncio.Task:
+    """Run a coroutine in the background without blocking the caller"""
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    return task
+
+# Prometheus-style metrics, rendered by /metrics in the text exposition format
+LATENCY_BUCKETS = (0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0)
+
+def format_labels(labels: Tuple[Tuple[str, str], ...], extra: str = "") -> str:
+    parts = [f'{name}="{value}"' for name, value in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+class Counter:
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help_text = help_text
+        self.values: Dict[Tuple[Tuple[str, str], ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = tuple(sorted(labels.items()))
+        self.values[key] = self.values.get(key, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        lines += [f"{self.name}{format_labels(key)} {value}" for key, value in self.values.items()]
+        return lines
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = buckets
+        self.series: Dict[Tuple[Tuple[str, str], ...], List[float]] = {}  # Bucket counts..., count, sum
+
+    def observe(self, value: float, **labels):
+        key = tuple(sorted(labels.items()))
+        counts = self.series.setdefault(key, [0] * (len(self.buckets) + 2))
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[index] += 1
+        counts[-2] += 1
+        counts[-1] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for key, counts in self.series.items():
+            for bound, count in zip(self.buckets + ("+Inf",), counts):
+                le = f'le="{bound}"'
+                lines.append(f"{self.name}_bucket{format_labels(key, le)} {count}")
+            lines.append(f"{self.name}_sum{format_labels(key)} {counts[-1]}")
+            lines.append(f"{self.name}_count{format_labels(key)} {counts[-2]}")
+        return lines
+
+def render_gauge(name: str, help_text: str, value: float) -> List[str]:
+    return [f"# HELP {name} {help_text}", f"# TYPE {name} gauge", f"{name} {value}"]
+
+turn_queue_seconds = Histogram("translation_turn_queue_seconds", "Prompt receipt to translation start")
+turn_first_token_seconds = Histogram("translation_turn_first_token_seconds", "Prompt receipt to first translated token")
+turn_first_send_seconds = Histogram("translation_turn_first_send_seconds", "Prompt receipt to first websocket send")
+turn_last_token_seconds = Histogram("translation_turn_last_token_seconds", "Prompt receipt to last translated token")
+turn_mouth_to_ear_seconds = Histogram("translation_turn_mouth_to_ear_seconds", "Prompt receipt to the listener's TTS starting")
+turns_total = Counter("translation_turns_total", "Translation turns by outcome")
+tokens_total = Counter("translation_tokens_total", "Translated tokens streamed to listeners")
+llm_hedges_total = Counter("translation_llm_hedges_total", "Hedged requests sent because the first token was late")
+llm_errors_total = Counter("translation_llm_errors_total", "LLM request errors by backend")
+llm_wait_seconds = Histogram("translation_llm_scheduler_wait_seconds", "Time LLM calls waited for rate budget")
+sessions_rejected_total = Counter("translation_sessions_rejected_total", "New sessions refused because the LLM budget is saturated")
+glossary_hits_total = Counter("translation_glossary_hits_total", "Protected glossary terms and numbers, and whole utterances answered from the glossary")
+fillers_total = Counter("translation_fillers_total", "Turns by whether filler covered a predicted wait")
+sessions_reaped_total = Counter("translation_sessions_reaped_total", "Sessions torn down for overstaying a lifecycle state")
+
+def resident_memory_bytes() -> int:
+    """Current resident set size of this worker, or the peak where /proc is unavailable"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+async def close_llm_stream(stream):
+    """Close an LLM response stream and its underlying HTTP connection"""
+    for candidate in (stream, getattr(stream, "completion_stream", None)):
+        close = getattr(candidate, "aclose", None) or getattr(candidate, "close", None)
+        if close is None:
+            continue
+        try:
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logging.debug(f"Error closing LLM stream: {e}")
+        return
+
+# One keep-alive pool shared by every translation request, so turns reuse warm TLS connections
+llm_http_client = httpx.AsyncClient(
+    http2=LLM_HTTP2,
+    limits=httpx.Limits(max_connections=LLM_MAX_CONNECTIONS, max_keepalive_connections=LLM_MAX_CONNECTIONS,
+                        keepalive_expiry=LLM_KEEPALIVE),
+    timeout=httpx.Timeout(60.0, connect=5.0),
+)
+
+# litellm takes seconds to import, so workers boot without it and load it on first use
+litellm = None
+
+def load_litellm():
+    """Import litellm and route its requests through the shared HTTP client"""
+    global litellm
+    if litellm is None:
+        import litellm as module
+        module.aclient_session = llm_http_client
+        litellm = module
+    return litellm
+
+async def acompletion(**kwargs):
+    """litellm.acompletion; the first call imports litellm off the event loop"""
+    module = litellm or await asyncio.to_thread(load_litellm)
+    return await module.acompletion(**kwargs)
+
+class TranslationBackend:
+    """One LLM deployment with a rolling time to first token and a circuit breaker"""
+    def __init__(self, name: str, model: str, **params):
+        self.name = name
+        self.model = model
+        self.params = params  # Extra acompletion arguments (api_base, api_version, api_key, ...)
+        self.ttft: Optional[float] = None  # Smoothed seconds to first token, None until measured
+        self.failures = 0  # Consecutive errors
+        self.ejected_until = 0.0
+        self.warmed_at = float("-inf")  # When a connection to api_base was last opened or checked
+
+    def healthy(self) -> bool:
+        return time.monotonic() >= self.ejected_until
+
+    def record_ttft(self, seconds: float):
+        self.failures = 0
+        self.ttft = seconds if self.ttft is None else TTFT_SMOOTHING * seconds + (1 - TTFT_SMOOTHING) * self.ttft
+
+    def record_abandoned(self, seconds: float):
+        """A request was cancelled after `seconds` without a token, so its TTFT was at least that"""
+        if self.ttft is None or seconds > self.ttft:
+            self.ttft = TTFT_SMOOTHING * seconds + (1 - TTFT_SMOOTHING) * (self.ttft or seconds)
+
+    def record_error(self, error: Exception):
+        self.failures += 1
+        llm_errors_total.inc(backend=self.name)
+        if self.failures >= BREAKER_THRESHOLD:
+            self.ejected_until = time.monotonic() + BREAKER_COOLDOWN
+            logging.warning(f"Ejecting translation backend {self.name} for {BREAKER_COOLDOWN}s after: {error}")
+
+class BackendRouter:
+    """Routes each request to the fastest healthy backend, hedging slow first tokens"""
+    def __init__(self, configs: List[dict]):
+        self.backends = [TranslationBackend(**config) for config in configs]
+
+    def expected_ttft(self) -> Optional[float]:
+        """Rolling time to first token of the backend the next request goes to, if measured"""
+        return self.ranked()[0].ttft
+
+    def ranked(self) -> List[TranslationBackend]:
+        """Healthy backends fastest first (unmeasured ones are tried first), then ejected ones"""
+        return sorted(self.backends, key=lambda backend: (not backend.healthy(), backend.ttft or 0.0))
+
+    async def _open(self, backend: TranslationBackend, messages: List[dict]):
+        """Start a stream on `backend` and wait for its first token"""
+        started = time.monotonic()
+        stream = None
+        try:
+            stream = await acompletion(
+                model=backend.model,
+                messages=messages,
+                stream=True,
+                temperature=0.3,  # Lower temperature for more consistent translations
+                **backend.params,
+            )
+            chunks = stream.__aiter__()
+            while True:
+                chunk = await chunks.__anext__()
+                if chunk.choices and chunk.choices[0].delta.content:
+                    break
+        except StopAsyncIteration:
+            backend.record_ttft(time.monotonic() - started)
+            return backend, stream, None, ""
+        except asyncio.CancelledError:
+            # Lost a hedge race (or the turn was cancelled): remember how slow it was
+            backend.record_abandoned(time.monotonic() - started)
+            if stream is not None:
+                await close_llm_stream(stream)
+            raise
+        except Exception as e:
+            backend.record_error(e)
+            if stream is not None:
+                await close_llm_stream(stream)
+            raise
+        backend.record_ttft(time.monotonic() - started)
+        return backend, stream, chunks, chunk.choices[0].delta.content
+
+    async def open_stream(self, messages: List[dict], tokens: int = 0):
+        """Return (backend, stream, chunk iterator, first token) from the first backend to answer.
+
+        The fastest healthy backend is asked first. If it has not produced a token
+        within HEDGE_AFTER, the next backend is asked as well and the loser is
+        cancelled. A backend that fails is replaced by the next untried one.
+        """
+        candidates = self.ranked()
+        pending = {asyncio.create_task(self._open(candidates.pop(0), messages))}
+        hedged = False
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, timeout=None if hedged else HEDGE_AFTER,
+                                                   return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    hedged = True
+                    if candidates:
+                        llm_hedges_total.inc()
+                        llm_scheduler.charge(tokens)
+                        pending.add(asyncio.create_task(self._open(candidates.pop(0), messages)))
+                    continue
+
+                winners = [task for task in done if not task.exception()]
+                for task in done:
+                    if task.exception():
+                        error = task.exception()
+                        if candidates and not pending and not winners:
+                            llm_scheduler.charge(tokens)
+                            pending.add(asyncio.create_task(self._open(candidates.pop(0), messages)))
+                if winners:
+                    for extra in winners[1:]:
+                        await close_llm_stream(extra.result()[1])
+                    return winners[0].result()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending)
+
+backend_router = BackendRouter(TRANSLATION_BACKENDS)
+
+class LatencyPredictor:
+    """Predicts how long a turn takes from the LLM call to its first translated chunk.
+
+    The wait is the serving backend's rolling time to first token plus a linear term
+    in the utterance's length (prompt processing, coalescing up to a phrase). The
+    term is fitted per language pair by exponentially weighted least squares on the
+    residuals of completed turns; pairs with few turns use the fit over all pairs.
+    """
+    def __init__(self, decay: float):
+        self.decay = decay
+        self.stats: Dict[str, List[float]] = {}  # Pair ("*" for all) -> weighted [n, sum x, sum y, sum xx, sum xy]
+
+    def _fit(self, pair: str) -> Tuple[float, float]:
+        """Return (intercept, seconds per token) of the residual for `pair`"""
+        stats = self.stats.get(pair)
+        if not stats or stats[0] < LATENCY_MIN_SAMPLES:
+            stats = self.stats.get("*")
+        if not stats:
+            return LATENCY_PRIOR_OVERHEAD, 0.0
+        n, sum_x, sum_y, sum_xx, sum_xy = stats
+        denominator = n * sum_xx - sum_x * sum_x
+        slope = max(0.0, (n * sum_xy - sum_x * sum_y) / denominator) if denominator > 1e-9 else 0.0
+        return (sum_y - slope * sum_x) / n, slope
+
+    def predict(self, pair: str, tokens: int, ttft: Optional[float]) -> float:
+        intercept, slope = self._fit(pair)
+        return max(0.0, (LATENCY_PRIOR_TTFT if ttft is None else ttft) + intercept + slope * tokens)
+
+    def observe(self, pair: str, tokens: int, ttft: Optional[float], seconds: float):
+        residual = seconds - (LATENCY_PRIOR_TTFT if ttft is None else ttft)
+        for key in (pair, "*"):
+            stats = self.stats.setdefault(key, [0.0] * 5)
+            for index, value in enumerate((1, tokens, residual, tokens * tokens, tokens * residual)):
+                stats[index] = stats[index] * self.decay + value
+
+latency_predictor = LatencyPredictor(LATENCY_DECAY)
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token)"""
+    return max(1, len(text) // 4)
+
+class TokenBucket:
+    def __init__(self, rate_per_second: float, capacity: float):
+        self.rate = rate_per_second
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until `amount` can be taken"""
+        self._refill()
+        amount = min(amount, self.capacity)
+        return 0.0 if self.tokens >= amount else (amount - self.tokens) / self.rate
+
+    def take(self, amount: float):
+        self._refill()
+        self.tokens -= min(amount, self.capacity)
+
+class LLMRequest:
+    def __init__(self, session_id: str, tokens: int, priority: int):
+        self.session_id = session_id
+        self.tokens = tokens  # Charged to the budget: prompt, context and expected completion
+        self.priority = priority  # Size of the utterance itself; smaller goes first
+        self.enqueued_at = time.monotonic()
+        self.granted: asyncio.Future = asyncio.get_running_loop().create_future()
+
+class LLMScheduler:
+    """Process-wide gate in front of every LLM call.
+
+    Calls are admitted within the LLM_RPM and LLM_TPM token buckets. Waiting calls
+    are served in rounds: every session with a waiting call is served once per
+    round, so a chatty caller cannot starve others, and within a round the call
+    for the shortest utterance (less an allowance for time waited) goes first.
+    Conversation context counts against the budget but not the priority, so calls
+    late in a long conversation are not pushed behind new ones.
+    """
+    def __init__(self, rpm: float, tpm: float):
+        self.requests = TokenBucket(rpm / 60, rpm / 60 * LLM_BURST_SECONDS)
+        self.tokens = TokenBucket(tpm / 60, tpm / 60 * LLM_BURST_SECONDS)
+        self.waiting: Dict[str, Deque[LLMRequest]] = {}
+        self.served_this_round: set = set()
+        self.wakeup = asyncio.Event()
+        self.dispatcher: Optional[asyncio.Task] = None
+
+    def queued(self) -> int:
+        return sum(len(requests) for requests in self.waiting.values())
+
+    def oldest_wait(self) -> float:
+        heads = [requests[0].enqueued_at for requests in self.waiting.values() if requests]
+        return time.monotonic() - min(heads) if heads else 0.0
+
+    def saturated(self) -> bool:
+        """Whether new sessions should be refused to protect the ones already talking"""
+        return self.queued() >= ADMISSION_MAX_QUEUE or self.oldest_wait() >= ADMISSION_MAX_WAIT
+
+    def charge(self, tokens: int):
+        """Account for an extra call (hedge or failover) without waiting"""
+        self.requests.take(1)
+        self.tokens.take(tokens)
+
+    async def acquire(self, session_id: str, tokens: int, priority: Optional[int] = None):
+        """Wait until a call of about `tokens` tokens fits the budget.
+
+        `priority` is the size of the utterance being translated, defaulting to `tokens`.
+        """
+        if not self.queued() and self.requests.wait_time(1) == 0 and self.tokens.wait_time(tokens) == 0:
+            self.charge(tokens)
+            llm_wait_seconds.observe(0.0)
+            return
+        request = LLMRequest(session_id, tokens, tokens if priority is None else priority)
+        self.waiting.setdefault(session_id, deque()).append(request)
+        if self.dispatcher is None or self.dispatcher.done():
+            self.dispatcher = asyncio.create_task(self._dispatch())
+        self.wakeup.set()
+        try:
+            await request.granted
+        finally:
+            if not request.granted.done():
+                request.granted.cancel()  # Caller gave up; the dispatcher skips it
+        llm_wait_seconds.observe(time.monotonic() - request.enqueued_at)
+
+    def _next(self) -> Optional[LLMRequest]:
+        # Drop calls whose turn was cancelled while waiting, and sessions with nothing left
+        for session_id, requests in list(self.waiting.items()):
+            live = deque(request for request in requests if not request.granted.done())
+            if live:
+                self.waiting[session_id] = live
+            else:
+                del self.waiting[session_id]
+        candidates = [key for key in self.waiting if key not in self.served_this_round]
+        if not candidates:
+            self.served_this_round.clear()
+            candidates = list(self.waiting)
+        if not candidates:
+            return None
+        now = time.monotonic()
+
+        def score(request: LLMRequest) -> float:
+            return request.priority - (now - request.enqueued_at) * SCHEDULER_AGING
+
+        return min((min(self.waiting[key], key=score) for key in candidates), key=score)
+
+    async def _dispatch(self):
+        while True:
+            request = self._next()
+            if request is None:
+                self.wakeup.clear()
+                await self.wakeup.wait()
+                continue
+            delay = max(self.requests.wait_time(1), self.tokens.wait_time(request.tokens))
+            if delay > 0:
+                # Re-pick after the wait: a shorter call may have arrived meanwhile
+                self.wakeup.clear()
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            self.waiting[request.session_id].remove(request)
+            if request.granted.done():
+                continue
+            self.charge(request.tokens)
+            self.served_this_round.add(request.session_id)
+            request.granted.set_result(True)
+
+llm_scheduler = LLMScheduler(LLM_RPM, LLM_TPM)
+
+PLACEHOLDER_INSTRUCTION = "Copy placeholders such as <t1> into the translation unchanged, in the right position."
+
+class ConversationContext:
+    """Rolling, token-budgeted history of a session's translated turns.
+
+    Turns are only appended, so consecutive requests share the same system and
+    history prefix and provider-side prompt caching can reuse it. Once the history
+    exceeds CONTEXT_TOKEN_BUDGET the oldest turns are dropped in one block down to
+    CONTEXT_COMPACT_TO, which keeps the prompt size bounded however long the call runs.
+    A conference keeps one context per listener language, given as `target_language`.
+    """
+    def __init__(self, budget: int = CONTEXT_TOKEN_BUDGET, compact_to: int = CONTEXT_COMPACT_TO,
+                 target_language: str = ""):
+        self.target_language = target_language
+        self.budget = budget
+        self.compact_to = compact_to
+        self.turns: Deque[Tuple[str, str, str, int]] = deque()  # (language, original, translation, tokens)
+        self.tokens = 0
+        self.compactions = 0
+
+    def append(self, language: str, original: str, translation: str):
+        tokens = estimate_tokens(original) + estimate_tokens(translation)
+        self.turns.append((language, original, translation, tokens))
+        self.tokens += tokens
+        if self.tokens > self.budget:
+            while self.turns and self.tokens > self.compact_to:
+                self.tokens -= self.turns.popleft()[3]
+            self.compactions += 1
+
+    def messages(self, source_lang: str, target_lang: str, text: str,
+                 history: Optional[List[Tuple[str, str]]] = None) -> List[dict]:
+        """Render the stable prefix followed by the utterance to translate"""
+        if self.target_language:
+            messages = [{"role": "system", "content": (
+                f"You are a professional real-time translator on a conference call. "
+                f"Each user message is one utterance prefixed with its language code; translate it into {self.target_language}. "
+                f"{PLACEHOLDER_INSTRUCTION} Provide only the translation, no explanations or additional text."
+            )}]
+        else:
+            # Sorted so both directions of the call share one system message
+            first, second = sorted((source_lang, target_lang))
+            messages = [{"role": "system", "content": (
+                f"You are a professional real-time translator on a phone call between a {first} speaker and a {second} speaker. "
+                "Each user message is one utterance prefixed with its language code; translate it into the other language of the call. "
+                f"{PLACEHOLDER_INSTRUCTION} Provide only the translation, no explanations or additional text."
+            )}]
+        for language, original, translation, _ in self.turns:
+            messages.append({"role": "user", "content": f"[{language}] {original}"})
+            messages.append({"role": "assistant", "content": translation})
+        for original, translation in history or []:
+            messages.append({"role": "user", "content": f"[{source_lang}] {original}"})
+            messages.append({"role": "assistant", "content": translation})
+        messages.append({"role": "user", "content": f"[{source_lang}] {text}"})
+        return messages
+
+async def translate_text_streaming(text: str, source_lang: str = "en-US", target_lang: str = "de-DE",
+                                   history: Optional[List[Tuple[str, str]]] = None, session_id: str = "",
+                                   context: Optional[ConversationContext] = None):
+    """Streaming translation function using OpenAI
+
+    `history` holds earlier (original, translation) pairs that the model sees as
+    already-translated context, e.g. the speculated prefix of the same utterance.
+    `session_id` is the caller the LLM scheduler queues the request under, and
+    `context` the session's rolling conversation history.
+    """
+    if context is not None:
+        messages = context.messages(source_lang, target_lang, text, history)
+    else:
+        messages = [
+            {"role": "system", "content": f"You are a professional real-time translator. Translate the following {source_lang} text to {target_lang}. Provide only the translation, no explanations or additional text."},
+        ]
+        for original, translation in history or []:
+            messages.append({"role": "user", "content": original})
+            messages.append({"role": "assistant", "content": translation})
+        messages.append({"role": "user", "content": text})
     # logging.info(f"Translating text: {text} from {source_lang} to {target_lang}")
-    stream = await acompletion(
-        model="azure/gpt-4.1-nano",
-        api_base = "https://ai-mateo5227ai919927469639.openai.azure.com/",
-        api_version = "2024-12-01-preview",
-        api_key = "3T3EuIFcgBiqLGtRbSd9PywVHAKw2RsbnROSIdWCmhPdvkIPnfD0JQQJ99BDACHYHv6XJ3w3AAAAACOGONVI",
-        messages=messages,
-        stream=True,
-        temperature=0.3,  # Lower temperature for more consistent translations
-    )
+    # Prompt plus an expected completion of about the same length
+    tokens = sum(estimate_tokens(message["content"]) for message in messages) + estimate_tokens(text)
+    await llm_scheduler.acquire(session_id, tokens, priority=estimate_tokens(text))
+    backend, stream, chunks, first_token = await backend_router.open_stream(messages, tokens)
 
-    async for chunk in stream:
-        if chunk.choices[0].delta.content is not None:
-            token = chunk.choices[0].delta.content
-            # logging.info(f"Received token from llm: {token}")
+    try:
+        if first_token:
             yield {
-                "token": token,
+                "token": first_token,
                 "last": False,
                 "type": "text",
             }
+        if chunks is not None:
+            async for chunk in chunks:
+                if chunk.choices and chunk.choices[0].delta.content is not None:
+                    token = chunk.choices[0].delta.content
+                    # logging.info(f"Received token from llm: {token}")
+                    yield {
+                        "token": token,
+                        "last": False,
+                        "type": "text",
+                    }
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        backend.record_error(e)
+        raise
+    finally:
+        # Runs on normal completion as well as when the turn is cancelled,
+        # so an aborted turn stops pulling (and paying for) upstream tokens.
+        await close_llm_stream(stream)
 
     yield {
         "token": "",
@@ -90,9 +1338,69 @@ async def translate_text_streaming(text: str, source_lang: str = "en-US", target
         "last": True,
     }
 
-def generate_conversation_relay_twiml(ws_url: str, language: str, tts_provider: str, voice: str = "") -> str:
+# Punctuation after which TTS can voice a chunk naturally
+PHRASE_BOUNDARY = re.compile(r"[.!?;:,。！？；，、\n]\s*$")
+
+async def coalesce_tokens(events, max_chars: int = COALESCE_MAX_CHARS, max_delay: float = COALESCE_MAX_DELAY):
+    """Merge per-token text events into phrase-sized chunks.
+
+    A chunk is flushed at a clause boundary, once it reaches `max_chars`, or when
+    `max_delay` seconds have passed since its first token, whichever comes first.
+    """
+    loop = asyncio.get_running_loop()
+    iterator = events.__aiter__()
+    pending: Optional[asyncio.Future] = None
+    buffer = ""
+    deadline: Optional[float] = None
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(iterator.__anext__())
+            timeout = None if deadline is None else max(0.0, deadline - loop.time())
+            done, _ = await asyncio.wait({pending}, timeout=timeout)
+            if not done:
+                yield {"token": buffer, "last": False, "type": "text"}
+                buffer, deadline = "", None
+                continue
+
+            finished, pending = pending, None
+            try:
+                event = finished.result()
+            except StopAsyncIteration:
+                break
+            if event["last"]:
+                yield {"token": buffer + event["token"], "last": True, "type": "text"}
+                buffer, deadline = "", None
+                continue
+
+            if not buffer:
+                deadline = loop.time() + max_delay
+            buffer += event["token"]
+            if len(buffer) >= max_chars or PHRASE_BOUNDARY.search(buffer):
+                yield {"token": buffer, "last": False, "type": "text"}
+                buffer, deadline = "", None
+
+        if buffer:
+            yield {"token": buffer, "last": False, "type": "text"}
+    finally:
+        if pending is not None and not pending.done():
+            # Cancelling the pending read unwinds the LLM stream and closes it
+            pending.cancel()
+            await asyncio.wait({pending})
+        aclose = getattr(iterator, "aclose", None)
+        if aclose:
+            await aclose()
+
+def encode_text_event(event: dict) -> str:
+    """Serialize a text event with a fixed layout; only the token needs escaping"""
+    last = "true" if event["last"] else "false"
+    return f'{{"type":"text","token":{json.dumps(event["token"], ensure_ascii=False)},"last":{last}}}'
+
+def generate_conversation_relay_twiml(ws_url: str, language: str, tts_provider: str, voice: str = "",
+                                      partial_prompts: bool = False) -> str:
     """Generate TwiML response for ConversationRelay with language and TTS settings"""
     voice_attr = f' voice="{voice}"' if voice else ''
+    partial_attr = ' partialPrompts="true"' if partial_prompts else ''
     # Set transcription provider based on language
     if language.startswith('ar-'):
         stt_attr = f' transcriptionProvider="google"'
@@ -108,174 +1416,1452 @@ def generate_conversation_relay_twiml(ws_url: str, language: str, tts_provider:
                         language="{language}"
                         ttsProvider="{tts_provider}"
                         {voice_attr}
-                        {stt_attr}/>
+                        {stt_attr}
+                        {partial_attr}/>
                 </Connect>
             </Response>'''
     return twiml
 
+class PhraseCatalog:
+    """Bounded cache of SYSTEM_PHRASES translated per language code.
+
+    Misses are translated once (concurrent callers share the same request) and
+    written back to PHRASE_CACHE_FILE when configured.
+    """
+    def __init__(self, phrases: Dict[str, str], max_entries: int, path: str = ""):
+        self.phrases = phrases
+        self.max_entries = max_entries
+        self.path = path
+        self.entries: "OrderedDict[str, str]" = OrderedDict()
+        self.pending: Dict[str, asyncio.Future] = {}
+        self.llm_calls = 0
+        self.dirty = False  # Entries changed since the last snapshot was written
+        self.save_task: Optional[asyncio.Task] = None  # The single task writing snapshots
+        self._load()
+
+    @staticmethod
+    def _key(phrase_key: str, language: str) -> str:
+        return f"{language}|{phrase_key}"
+
+    def _load(self):
+        if not (self.path and os.path.exists(self.path)):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                saved = json.load(f)
+            for key, text in list(saved.items())[-self.max_entries:]:
+                self.entries[key] = text
+            logging.info(f"Loaded {len(self.entries)} cached phrases from {self.path}")
+        except Exception as e:
+            logging.error(f"Error loading phrase cache {self.path}: {e}")
+
+    def _save(self, snapshot: Dict[str, str]):
+        # A temp file of its own, since every gunicorn worker writes the same cache file
+        fd, tmp_path = tempfile.mkstemp(prefix=f"{os.path.basename(self.path)}.", suffix=".tmp",
+                                        dir=os.path.dirname(os.path.abspath(self.path)))
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    async def _write_snapshots(self):
+        while self.dirty:
+            self.dirty = False
+            try:
+                await asyncio.to_thread(self._save, dict(self.entries))
+            except Exception as e:
+                logging.error(f"Error saving phrase cache {self.path}: {e}")
+
+    def _persist(self):
+        """Schedule a save; misses arriving during a write are folded into one more snapshot"""
+        if not self.path:
+            return
+        self.dirty = True
+        if self.save_task is None or self.save_task.done():
+            self.save_task = spawn_background(self._write_snapshots())
+
+    def _store(self, key: str, text: str):
+        self.entries[key] = text
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    async def get(self, phrase_key: str, language: str) -> str:
+        """Return the phrase in `language`, translating it only on the first request"""
+        text = self.phrases[phrase_key]
+        if not language or language.split("-")[0] == PHRASE_BASE_LANGUAGE.split("-")[0]:
+            return text
+
+        key = self._key(phrase_key, language)
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return self.entries[key]
+        if key in self.pending:
+            return await asyncio.shield(self.pending[key])
+
+        future = asyncio.get_running_loop().create_future()
+        self.pending[key] = future
+        try:
+            translated = ""
+            self.llm_calls += 1
+            async for event in translate_text_streaming(text, PHRASE_BASE_LANGUAGE, language):
+                translated += event["token"]
+            translated = translated.strip() or text
+            self._store(key, translated)
+            future.set_result(translated)
+        except BaseException as e:
+            # Fall back to the untranslated phrase rather than failing the caller
+            logging.error(f"Error translating phrase {phrase_key} to {language}: {e}")
+            future.set_result(text)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            return text
+        finally:
+            self.pending.pop(key, None)
+        self._persist()
+        return translated
+
+    async def warm(self, languages: List[str]):
+        """Pre-translate every phrase for `languages`, skipping entries already cached"""
+        await asyncio.gather(*(
+            self.get(phrase_key, language)
+            for language in languages
+            for phrase_key in self.phrases
+        ), return_exceptions=True)
+        if self.save_task:
+            await self.save_task
+        logging.info(f"Phrase catalog warm: {len(self.entries)} entries, {self.llm_calls} LLM calls")
+
+phrase_catalog = PhraseCatalog(SYSTEM_PHRASES, PHRASE_CACHE_SIZE, PHRASE_CACHE_FILE)
+
+def normalize_utterance(text: str) -> str:
+    """Cache key form of an utterance: case, spacing and trailing periods don't change the translation"""
+    return " ".join(text.casefold().split()).rstrip(".,")
+
+class SharedTranslationCache:
+    """SQLite table of translations visible to every worker on the host"""
+    def __init__(self, path: str, ttl: float):
+        self.path = path
+        self.ttl = ttl
+        self.writes = 0
+        with self._connect() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS translations (key TEXT PRIMARY KEY, translation TEXT, expires_at REAL)")
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=1.0)
+
+    def _get(self, key: str) -> Optional[str]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT translation FROM translations WHERE key = ? AND expires_at > ?",
+                               (key, time.time())).fetchone()
+        return row[0] if row else None
+
+    def _set(self, key: str, translation: str):
+        with self._connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO translations VALUES (?, ?, ?)", (key, translation, time.time() + self.ttl))
+            self.writes += 1
+            if self.writes % 500 == 0:
+                conn.execute("DELETE FROM translations WHERE expires_at <= ?", (time.time(),))
+
+    async def get(self, key: str) -> Optional[str]:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, translation: str):
+        await asyncio.to_thread(self._set, key, translation)
+
+class TranslationCache:
+    """Per-worker LRU/TTL cache of short utterance translations, backed by an optional shared cache"""
+    def __init__(self, max_entries: int, max_bytes: int, ttl: float, shared: Optional[SharedTranslationCache] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.shared = shared
+        self.entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()  # key -> (translation, expires_at)
+        self.bytes = 0
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        """Return the cache key for an utterance, or None if it is too long to be worth caching"""
+        normalized = normalize_utterance(text)
+        if not normalized or len(normalized) > TRANSLATION_CACHE_MAX_CHARS:
+            return None
+        return f"{source_lang}|{target_lang}|{normalized}"
+
+    @staticmethod
+    def _size(key: str, translation: str) -> int:
+        return len(key.encode()) + len(translation.encode())
+
+    def _remove(self, key: str):
+        translation, _ = self.entries.pop(key)
+        self.bytes -= self._size(key, translation)
+
+    def _store(self, key: str, translation: str, expires_at: float):
+        if key in self.entries:
+            self._remove(key)
+        self.entries[key] = (translation, expires_at)
+        self.bytes += self._size(key, translation)
+        while self.entries and (len(self.entries) > self.max_entries or self.bytes > self.max_bytes):
+            self._remove(next(iter(self.entries)))
+            self.evictions += 1
+
+    def contains(self, key: str) -> bool:
+        """Whether this worker holds a fresh translation for `key`, without counting a lookup"""
+        entry = self.entries.get(key)
+        return entry is not None and entry[1] > time.monotonic()
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self.entries.get(key)
+        if entry:
+            if entry[1] > time.monotonic():
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self._remove(key)
+            self.evictions += 1
+
+        if self.shared:
+            try:
+                translation = await self.shared.get(key)
+            except Exception as e:
+                logging.error(f"Shared translation cache lookup failed: {e}")
+                translation = None
+            if translation is not None:
+                self._store(key, translation, time.monotonic() + self.ttl)
+                self.shared_hits += 1
+                return translation
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, translation: str):
+        self._store(key, translation, time.monotonic() + self.ttl)
+        if self.shared:
+            try:
+                await self.shared.set(key, translation)
+            except Exception as e:
+                logging.error(f"Shared translation cache write failed: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self.entries),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+translation_cache = TranslationCache(
+    TRANSLATION_CACHE_SIZE,
+    TRANSLATION_CACHE_MAX_BYTES,
+    TRANSLATION_CACHE_TTL,
+    SharedTranslationCache(TRANSLATION_CACHE_DB, TRANSLATION_CACHE_TTL) if TRANSLATION_CACHE_DB else None,
+)
+
+async def translate_cached(text: str, source_lang: str, target_lang: str, session_id: str = "",
+                           context: Optional[ConversationContext] = None):
+    """translate_text_streaming with repeated short utterances answered from translation_cache"""
+    key = TranslationCache.key(text, source_lang, target_lang)
+    if key:
+        cached = await translation_cache.get(key)
+        if cached is not None:
+            # Replay as one complete utterance; there is nothing to stream
+            yield {"token": cached, "type": "text", "last": True}
+            return
+
+    translated = ""
+    async for event in translate_text_streaming(text, source_lang, target_lang, session_id=session_id, context=context):
+        translated += event["token"]
+        yield event
+
+    # Only reached when the stream completed, so cancelled turns are never cached
+    if key and translated.strip():
+        await translation_cache.set(key, translated)
+
+NUMBER_PATTERN = re.compile(r"\d(?:[\d\s.,:/-]*\d)?")
+PLACEHOLDER_PATTERN = re.compile(r"<\s*[tT]\s*(\d+)\s*>")
+
+class Glossary:
+    """Glossary terms compiled into one Aho-Corasick automaton.
+
+    `entries` maps a term to None (keep it verbatim), one rendering for every
+    language, or {language: rendering}; languages also match by their prefix
+    ("de" covers "de-DE"). Utterances are scanned once, case-insensitively, for
+    the leftmost-longest terms on word boundaries, however many terms there are.
+    """
+    def __init__(self, entries: Dict[str, object]):
+        self.entries = entries
+        self.terms = [term for term in entries if term.strip()]
+        self.exact = {normalize_utterance(term): index for index, term in enumerate(self.terms)}
+        # Trie as parallel lists: goto transitions, failure links, and the lengths of terms ending here
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[List[Tuple[int, int]]] = [[]]  # (term index, term length)
+        for index, term in enumerate(self.terms):
+            node = 0
+            for char in fold(term):
+                if char not in self.goto[node]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                    self.goto[node][char] = len(self.goto) - 1
+                node = self.goto[node][char]
+            self.output[node].append((index, len(term)))
+        # Breadth-first, so every failure link points at an already finished, shallower node
+        queue_ = deque(self.goto[0].values())  # Depth-1 nodes fail to the root
+        while queue_:
+            node = queue_.popleft()
+            for char, child in self.goto[node].items():
+                queue_.append(child)
+                fallback = self.fail[node]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                self.output[child] = self.output[child] + self.output[self.fail[child]]
+
+    def rendering(self, index: int, matched: str, language: str) -> str:
+        """The term in `language`, or the text as spoken if it is kept verbatim"""
+        translations = self.entries[self.terms[index]]
+        if isinstance(translations, str):
+            return translations
+        if isinstance(translations, dict):
+            return translations.get(language) or translations.get(language.split("-")[0]) or matched
+        return matched
+
+    def matches(self, text: str) -> List[Tuple[int, int, int]]:
+        """Non-overlapping (start, end, term index) matches, leftmost-longest, on word boundaries"""
+        found = []
+        node = 0
+        for position, char in enumerate(fold(text)):
+            while node and char not in self.goto[node]:
+                node = self.fail[node]
+            node = self.goto[node].get(char, 0)
+            for index, length in self.output[node]:
+                start = position + 1 - length
+                if (start == 0 or not text[start - 1].isalnum()) and (position + 1 == len(text) or not text[position + 1].isalnum()):
+                    found.append((start, position + 1, index))
+        found.sort(key=lambda match: (match[0], match[0] - match[1]))
+        chosen = []
+        for match in found:
+            if not chosen or match[0] >= chosen[-1][1]:
+                chosen.append(match)
+        return chosen
+
+    def exact_hit(self, text: str, language: str) -> Optional[str]:
+        """The rendering when the whole utterance is one glossary term"""
+        index = self.exact.get(normalize_utterance(text))
+        return None if index is None else self.rendering(index, self.terms[index], language)
+
+    def protect(self, text: str, language: str) -> Tuple[str, List[str]]:
+        """Replace glossary terms (and numbers) with <tN> placeholders, returning the renderings to restore"""
+        spans = [(start, end, self.rendering(index, text[start:end], language))
+                 for start, end, index in self.matches(text)]
+        if GLOSSARY_PROTECT_NUMBERS:
+            for number in NUMBER_PATTERN.finditer(text):
+                if not any(start < number.end() and number.start() < end for start, end, _ in spans):
+                    spans.append((number.start(), number.end(), number.group()))
+            spans.sort()
+        protected, replacements, position = "", [], 0
+        for start, end, rendering in spans:
+            replacements.append(rendering)
+            protected += text[position:start] + f"<t{len(replacements)}>"
+            position = end
+        return protected + text[position:], replacements
+
+def fold(text: str) -> str:
+    """Lower-case `text` character by character, so match offsets line up with the original"""
+    return "".join(char if len(char.lower()) != 1 else char.lower() for char in text)
+
+def parse_glossary(value) -> Dict[str, object]:
+    """Validate a glossary given as a JSON object or its text"""
+    if not value:
+        return {}
+    entries = json.loads(value) if isinstance(value, str) else value
+    if not isinstance(entries, dict) or not all(
+            translation is None or isinstance(translation, (str, dict)) for translation in entries.values()):
+        raise ValueError("Glossary must map terms to null, a rendering or {language: rendering}")
+    return entries
+
+def load_glossary(path: str) -> Dict[str, object]:
+    if not path:
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            return parse_glossary(json.load(f))
+    except (OSError, ValueError) as e:
+        logging.error(f"Could not load glossary {path}: {e}")
+        return {}
+
+global_glossary = Glossary(load_glossary(GLOSSARY_FILE))
+
+async def restore_terms(events, replacements: List[str]):
+    """Swap <tN> placeholders in a translation stream back for their renderings"""
+    def restore(match) -> str:
+        index = int(match.group(1)) - 1
+        return replacements[index] if 0 <= index < len(replacements) else ""
+
+    pending = ""
+    async for event in events:
+        text = pending + event["token"]
+        pending = ""
+        # Hold back a fragment that may be the start of a placeholder split across chunks
+        cut = text.rfind("<")
+        if not event["last"] and cut != -1 and ">" not in text[cut:] and len(text) - cut < 8:
+            text, pending = text[:cut], text[cut:]
+        if text or event["last"]:
+            yield {**event, "token": PLACEHOLDER_PATTERN.sub(restore, text)}
+
+SESSION_ID_PATTERN = re.compile(r"[\w+-]+")
+
+class TranscriptWriter:
+    """Structured per-session transcripts written in batches by one background task.
+
+    Callers on the live path only `put_nowait` onto a bounded queue; when the writer
+    falls behind, records are dropped and counted rather than delaying a send. Each
+    batch is appended to `<session_id>.jsonl.gz` as its own gzip member, which gzip
+    readers treat as one continuous stream.
+    """
+    def __init__(self, directory: str, queue_size: int):
+        self.directory = directory
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0
+        self.written = 0
+        self.batching = False  # A batch has been taken off the queue but not yet written
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def path(self, session_id: str) -> Optional[str]:
+        if not self.directory or not SESSION_ID_PATTERN.fullmatch(session_id):
+            return None
+        return os.path.join(self.directory, f"{session_id}.jsonl.gz")
+
+    def record(self, session_id: str, event: str, **fields):
+        """Queue one transcript record without waiting"""
+        if not self.directory:
+            return
+        try:
+            self.queue.put_nowait((session_id, {"event": event, "time": time.time(), **fields}))
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    def _write(self, batch: Dict[str, List[dict]]):
+        for session_id, records in batch.items():
+            path = self.path(session_id)
+            if not path:
+                continue
+            data = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+            with open(path, "ab") as f:
+                f.write(gzip.compress(data.encode("utf-8")))
+            self.written += len(records)
+
+    async def run(self):
+        """Drain the queue, grouping records by session into batched writes"""
+        while True:
+            session_id, record = await self.queue.get()
+            self.batching = True
+            batch: Dict[str, List[dict]] = {session_id: [record]}
+            count = 1
+            deadline = time.monotonic() + TRANSCRIPT_FLUSH_INTERVAL
+            while count < TRANSCRIPT_BATCH_SIZE:
+                try:
+                    session_id, record = await asyncio.wait_for(self.queue.get(), deadline - time.monotonic())
+                except asyncio.TimeoutError:
+                    break
+                batch.setdefault(session_id, []).append(record)
+                count += 1
+            try:
+                await asyncio.to_thread(self._write, batch)
+            except Exception as e:
+                logging.error(f"Transcript write error: {e}")
+            finally:
+                self.batching = self.queue.qsize() > 0
+
+    async def flush(self, timeout: float):
+        """Wait up to `timeout` seconds for queued records to reach disk"""
+        deadline = time.monotonic() + timeout
+        while (self.batching or self.queue.qsize()) and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+
+    def _read(self, session_id: str) -> Optional[List[dict]]:
+        path = self.path(session_id)
+        if not path or not os.path.exists(path):
+            return None
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    async def read(self, session_id: str) -> Optional[List[dict]]:
+        return await asyncio.to_thread(self._read, session_id)
+
+transcript_writer = TranscriptWriter(TRANSCRIPT_DIR, TRANSCRIPT_QUEUE_SIZE)
+
+async def send_system_phrase(websocket: WebSocket, phrase_key: str, language: str):
+    """Speak a catalog phrase to one participant in their language"""
+    await websocket.send_json({
+        "type": "text",
+        "token": await phrase_catalog.get(phrase_key, language),
+        "last": True,
+    })
+
 async def check_session_readiness_and_notify(session: TranslationSession, session_id: str) -> bool:
     """Check if session is ready and send appropriate notifications to users.
 
     Returns:
         bool: True if session is ready for translation, False if still waiting
     """
-    if not (session.source_websocket and session.target_websocket):
+    source_websocket = session.websocket_for("source")
+    target_websocket = session.websocket_for("target")
+    if not (source_websocket and target_websocket):
         logging.info(f"Source or target websocket not ready for session {session_id}")
+        await session_lifecycle.transition(session, "waiting")
 
-        wait_event = {
-            "type": "play",
-            "source": wait_url,
-            "loop": 0,
-            "preemptible": True,
-            "interruptible": False
-        }
-
-        # Send waiting message in appropriate language to each participant
-        if session.source_websocket:
-            await session.source_websocket.send_json(wait_event)
-
-        if session.target_websocket:
-            await session.source_websocket.send_json(wait_event)
+        # A peer who has answered connects within moments; only a ringing one is worth music
+        peer = "target" if source_websocket else "source"
+        if peer not in session.answered:
+            await play_wait_music(source_websocket or target_websocket)
 
         return False
     else:
+        if session.state == "active":
+            return True  # The other leg's setup got here first and greeted both
+        await session_lifecycle.transition(session, "active")
         # Send ready message in appropriate language to each participant
-        # Translate ready message to source language
-        source_ready_text = ""
-        async for event in translate_text_streaming(
-            "You are ready to talk.",
-            "en-US",
-            session.source_language
-        ):
-            source_ready_text += event["token"]
-
-        ready_message_source = {
-            "type": "text",
-            "token": source_ready_text,
-            "last": True,
-        }
-        await session.source_websocket.send_json(ready_message_source)
-
-        # Translate ready message to target language
-        target_ready_text = ""
-        async for event in translate_text_streaming(
-            "You are ready to talk.",
-            "en-US",
-            session.target_language
-        ):
-            target_ready_text += event["token"]
-
-        ready_message_target = {
-            "type": "text",
-            "token": target_ready_text,
-            "last": True,
-        }
-        await session.target_websocket.send_json(ready_message_target)
+        await asyncio.gather(
+            send_system_phrase(source_websocket, "ready", session.source_language),
+            send_system_phrase(target_websocket, "ready", session.target_language),
+        )
 
         return True
 
 async def cleanup_session(session_id: str):
     
-    if session_id not in translation_sessions:
+    session = await translation_sessions.get(session_id)
+    if not session:
         return
     
-    session = translation_sessions[session_id]
+    if session_lifecycle.state(session_id) == "draining":
+        return  # Another cleanup of this session is already running
+
+    await session_lifecycle.transition(session, "draining")
+    await session.stop_pipelines()
+
     end_message = {
         "type": "end",
         "handoffData": "clean up session"
     }
     
-    if session.source_websocket:
-        try:
-            await session.source_websocket.send_json(end_message)
-            await session.source_websocket.close()
-        except Exception as e:
-            logging.error(f"Error closing source WebSocket: {e}")
-        finally:
-            session.source_websocket = None
-    
-    if session.target_websocket:
+    for role in session.roles():
+        websocket = session.websocket_for(role)
+        if not websocket:
+            # The leg never connected; stop it ringing
+            await end_twilio_call(session.call_sid_for(role))
+            continue
         try:
-            await session.target_websocket.send_json(end_message)
-            await session.target_websocket.close()
+            await websocket.send_json(end_message)
+            await websocket.close()
         except Exception as e:
-            logging.error(f"Error closing target WebSocket: {e}")
+            logging.error(f"Error closing {role} WebSocket: {e}")
         finally:
-            session.target_websocket = None
-    
-    translation_sessions.pop(session_id, None)
+            session.attach(role, None)
+
+    await translation_sessions.pop(session_id)
+    session_lifecycle.forget(session_id)
+    message_log.forget(session_id)
+    transcript_writer.record(session_id, "end")
     logging.info(f"Translation session {session_id} removed")
 
-async def play_waiting_music(websocket: WebSocket):
-    """Play music while waiting for response"""
-    music_event = {
+class SessionLifecycle:
+    """Per-state deadlines for every session this worker knows about.
+
+    All deadlines live in one heap served by a single reaper task, so idle sessions
+    cost a heap entry rather than a sleeping task each. Entries are replaced lazily:
+    a transition pushes a new entry and the stale one is skipped when it comes due.
+    The state itself is stored on the session, so under a shared session store a
+    deadline is re-checked against transitions made by other workers before acting.
+    """
+    def __init__(self, deadlines: Dict[str, float]):
+        self.deadlines = deadlines
+        self.heap: List[Tuple[float, int, str]] = []  # (monotonic deadline, sequence, session_id)
+        self.current: Dict[str, Tuple[int, str]] = {}  # session_id -> (sequence, state) of the live entry
+        self.sequence = 0
+        self.wakeup = asyncio.Event()
+
+    def state(self, session_id: str) -> Optional[str]:
+        entry = self.current.get(session_id)
+        return entry[1] if entry else None
+
+    def counts(self) -> Dict[str, int]:
+        counts = {state: 0 for state in SESSION_STATES}
+        for _, state in self.current.values():
+            counts[state] += 1
+        return counts
+
+    async def transition(self, session: TranslationSession, state: str):
+        """Move `session` into `state` and restart its deadline"""
+        if session.state != state:
+            session.state = state
+            session.state_changed_at = time.time()
+            await translation_sessions.save(session, "state", "state_changed_at")
+        self._schedule(session.session_id, state, session.state_changed_at)
+
+    def _schedule(self, session_id: str, state: str, changed_at: float):
+        remaining = self.deadlines[state] - (time.time() - changed_at)
+        self.sequence += 1
+        self.current[session_id] = (self.sequence, state)
+        deadline = time.monotonic() + max(0.0, remaining)
+        if not self.heap or deadline < self.heap[0][0]:
+            self.wakeup.set()
+        heapq.heappush(self.heap, (deadline, self.sequence, session_id))
+        # Drop stale entries once they outnumber live ones so the heap stays proportional to sessions
+        if len(self.heap) > 2 * len(self.current) + 64:
+            self.heap = [entry for entry in self.heap if self.current.get(entry[2], (None,))[0] == entry[1]]
+            heapq.heapify(self.heap)
+
+    def forget(self, session_id: str):
+        self.current.pop(session_id, None)
+
+    async def _expire(self, session_id: str, state: str):
+        current = await translation_sessions.state_of(session_id)
+        if current is None:
+            self.forget(session_id)
+            return
+        if current[0] != state:
+            # Another worker moved the session on; follow its state instead
+            self._schedule(session_id, *current)
+            return
+        session = await translation_sessions.get(session_id)
+        sessions_reaped_total.inc(state=state)
+        if state == "draining":
+            logging.warning(f"Session {session_id} did not finish cleanup, dropping it")
+            await translation_sessions.pop(session_id)
+            self.forget(session_id)
+            spawn_background(session.stop_pipelines())
+        else:
+            logging.warning(f"Session {session_id} exceeded its {state} deadline, ending it")
+            spawn_background(cleanup_session(session_id))
+
+    async def run(self):
+        """Tear down sessions as their deadlines pass"""
+        while True:
+            self.wakeup.clear()
+            delay = self.heap[0][0] - time.monotonic() if self.heap else None
+            if delay is None or delay > 0:
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+            now = time.monotonic()
+            while self.heap and self.heap[0][0] <= now:
+                _, sequence, session_id = heapq.heappop(self.heap)
+                entry = self.current.get(session_id)
+                if entry and entry[0] == sequence:
+                    try:
+                        await self._expire(session_id, entry[1])
+                    except Exception as e:
+                        logging.error(f"Session reaper error for {session_id}: {e}")
+
+session_lifecycle = SessionLifecycle(SESSION_DEADLINES)
+
+class WorkerDrain:
+    """Hold back the server's SIGTERM shutdown until this worker's calls have ended.
+
+    Uvicorn closes every websocket as soon as it handles SIGTERM, which hangs up
+    live calls on deploys and gunicorn worker recycling. The handler installed here
+    only flips the worker into draining: new sessions are refused and /health/ready
+    fails so the load balancer routes elsewhere, while existing sessions carry on.
+    Once they have all ended, or DRAIN_TIMEOUT passes and the rest are cleaned up,
+    the server's own handler is called to shut down. A second SIGTERM skips the wait.
+    """
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self.started_at: Optional[float] = None  # Monotonic time the first SIGTERM arrived
+        self.exit_handler = None  # The server's SIGTERM handler, called once drained
+
+    @property
+    def draining(self) -> bool:
+        return self.started_at is not None
+
+    def install(self):
+        """Take over SIGTERM from the server; must run on the main thread's event loop"""
+        if threading.current_thread() is not threading.main_thread():
+            return
+        loop = asyncio.get_running_loop()
+        self.exit_handler = signal.getsignal(signal.SIGTERM)
+        signal.signal(signal.SIGTERM,
+                      lambda signum, frame: loop.call_soon_threadsafe(self.on_sigterm, signum, frame))
+
+    def on_sigterm(self, signum: int, frame):
+        if self.draining:
+            logging.warning("Second SIGTERM received, exiting without waiting for calls")
+            self.exit(signum, frame)
+            return
+        self.started_at = time.monotonic()
+        logging.warning(f"SIGTERM received, draining {len(translation_sessions.values())} sessions "
+                        f"for up to {self.timeout:.0f}s")
+        spawn_background(self.drain(signum, frame))
+
+    async def drain(self, signum: int, frame):
+        deadline = self.started_at + self.timeout
+        while translation_sessions.values() and time.monotonic() < deadline:
+            await asyncio.sleep(DRAIN_POLL_INTERVAL)
+        remaining = translation_sessions.values()
+        if remaining:
+            logging.warning(f"Drain deadline passed, ending {len(remaining)} sessions")
+            await asyncio.gather(*(cleanup_session(session.session_id) for session in remaining),
+                                 return_exceptions=True)
+        await transcript_writer.flush(TRANSCRIPT_FLUSH_INTERVAL + 1)
+        logging.info(f"Drained in {time.monotonic() - self.started_at:.1f}s, shutting down")
+        self.exit(signum, frame)
+
+    def exit(self, signum: int, frame):
+        if callable(self.exit_handler):
+            self.exit_handler(signum, frame)
+        else:
+            # No server handler to defer to: restore the previous disposition and re-raise
+            signal.signal(signal.SIGTERM, self.exit_handler or signal.SIG_DFL)
+            signal.raise_signal(signum)
+
+worker_drain = WorkerDrain(DRAIN_TIMEOUT)
+
+async def play_wait_music(websocket: WebSocket):
+    """Loop music for a participant waiting for the other party to join"""
+    await websocket.send_json({
         "type": "play",
-        "source": music_url,
+        "source": wait_url,
         "loop": 0,
         "preemptible": True,
-        "interruptible": True
-    }
-    await websocket.send_json(music_event)
+        "interruptible": False
+    })
+
+async def play_filler(websocket: WebSocket, language: str):
+    """Cover a listener's wait for a translation; the first text sent afterwards preempts it"""
+    if FILLER_MODE == "phrase":
+        await websocket.send_json({
+            "type": "text",
+            "token": await phrase_catalog.get("hold", language),
+            "last": True,
+            "interruptible": True,
+            "preemptible": True,
+        })
+    else:
+        await websocket.send_json({
+            "type": "play",
+            "source": FILLER_AUDIO_URL,
+            "loop": 0,
+            "preemptible": True,
+            "interruptible": True
+        })
 
-async def create_outbound_target_call(session_id: str, host: str, target_number: str, twilio_number: str):
-    """Create outbound call to target language speaker"""
+async def flush_utterance(websocket: Optional[WebSocket]):
+    """Terminate a half-sent utterance so the listener's TTS drops it"""
+    if not websocket:
+        return
     try:
-        # Get existing session and update it
-        if session_id not in translation_sessions:
-            logging.error(f"Session {session_id} not found!")
+        await websocket.send_json({
+            "type": "text",
+            "token": "",
+            "last": True,
+            "interruptible": True,
+            "preemptible": True,
+        })
+    except Exception as e:
+        logging.error(f"Error flushing utterance: {e}")
+
+# Marks the end of a turn's event stream (completed, failed or cancelled)
+TURN_END = None
+
+# A clause boundary the speaker has already moved past
+CLAUSE_BOUNDARY = re.compile(r"[.!?;:,](?=\s+\S)|[。！？；，、](?=\S)")
+
+# Process-wide speculation counters
+speculation_stats = {
+    "hits": 0,  # Final transcript extended the speculated prefix
+    "misses": 0,  # Speculation discarded because the transcript changed
+    "saved_ms": 0.0,  # Translation time already done when the final transcript arrived
+    "wasted_tokens": 0,  # Tokens generated by discarded speculations
+}
+
+def stable_prefix(partial: str, previous_partial: str) -> str:
+    """Return the longest clause-terminated prefix shared by two consecutive partial transcripts"""
+    for match in reversed(list(CLAUSE_BOUNDARY.finditer(partial))):
+        prefix = partial[:match.end()]
+        if previous_partial.startswith(prefix):
+            return prefix
+    return ""
+
+class Speculation:
+    """Translation of a partial transcript's stable prefix, started before the final prompt"""
+    def __init__(self, prefix: str, source_lang: str, target_lang: str, session_id: str = "",
+                 context: Optional[ConversationContext] = None):
+        self.prefix = prefix
+        self.session_id = session_id
+        self.context = context
+        self.events: asyncio.Queue = asyncio.Queue()  # Unbounded: nobody consumes until the final prompt
+        self.translation = ""
+        self.token_count = 0
+        self.started_at = time.monotonic()
+        self.finished_at: Optional[float] = None
+        self.task = asyncio.create_task(self._run(source_lang, target_lang))
+
+    async def _run(self, source_lang: str, target_lang: str):
+        try:
+            async for event in translate_text_streaming(self.prefix, source_lang, target_lang,
+                                                        session_id=self.session_id, context=self.context):
+                if event["last"]:
+                    break
+                self.translation += event["token"]
+                self.token_count += 1
+                self.events.put_nowait(event)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logging.error(f"Speculative translation failed: {e}")
+        self.finished_at = time.monotonic()
+        self.events.put_nowait(TURN_END)
+
+    def matches(self, text: str) -> bool:
+        """Whether the final transcript extends the prefix and the speculation has not failed"""
+        failed = self.finished_at is not None and not self.translation
+        return text.startswith(self.prefix) and not failed
+
+    def discard(self):
+        self.task.cancel()
+        speculation_stats["misses"] += 1
+        speculation_stats["wasted_tokens"] += self.token_count
+
+    def adopt(self):
+        now = time.monotonic()
+        speculation_stats["hits"] += 1
+        speculation_stats["saved_ms"] += ((self.finished_at or now) - self.started_at) * 1000
+
+async def translate_with_speculation(text: str, speculation: Speculation, source_lang: str, target_lang: str):
+    """Replay a speculated prefix translation, then translate only the remaining tail"""
+    while True:
+        event = await speculation.events.get()
+        if event is TURN_END:
+            break
+        yield event
+
+    tail = text[len(speculation.prefix):].strip()
+    if not tail:
+        yield {"token": "", "type": "text", "last": True}
+        return
+    if not target_lang.startswith(("ja", "zh")):
+        yield {"token": " ", "type": "text", "last": False}
+    async for event in translate_text_streaming(tail, source_lang, target_lang,
+                                                history=[(speculation.prefix, speculation.translation)],
+                                                session_id=speculation.session_id, context=speculation.context):
+        yield event
+
+class TranslationTurn:
+    """One utterance travelling from the translator stage to the sender stage"""
+    def __init__(self, speaker: str, prompt: str, speculation: Optional[Speculation] = None):
+        self.speaker = speaker
+        self.prompt = prompt
+        self.speculation = speculation  # Adopted prefix translation, if any
+        self.timings: Dict[str, float] = {}  # Stage name -> time.monotonic() when it was reached
+        self.events: asyncio.Queue = asyncio.Queue(maxsize=TURN_EVENT_QUEUE_SIZE)
+        self.task: Optional[asyncio.Task] = None  # Task pulling tokens from the LLM
+        self.cancelled = False
+        self.skipped: set = set()  # Conference listeners who barged in and no longer receive this turn
+        self.predicted_wait: Optional[float] = None  # Seconds from the LLM call to the first chunk, None without a call
+        self.expected_ttft: Optional[float] = None  # Backend time to first token the prediction used
+
+    def cancel(self):
+        """Abort the LLM stream, drop unsent tokens and wake the sender"""
+        if self.cancelled:
+            return
+        self.cancelled = True
+        if self.task:
+            self.task.cancel()
+        if self.speculation:
+            self.speculation.task.cancel()
+        while not self.events.empty():
+            self.events.get_nowait()
+        self.events.put_nowait(TURN_END)
+
+class TurnPipeline:
+    """Reader -> translator -> sender stages for one speaking direction of a session.
+
+    The websocket endpoint is the reader: it only enqueues prompts and never waits
+    on the LLM. The translator starts up to MAX_TURNS_IN_FLIGHT translations, and the
+    sender delivers their tokens to the listener's websocket in prompt order. All
+    queues are bounded, so a slow listener pauses the LLM stream instead of buffering.
+    """
+    def __init__(self, session: TranslationSession, speaker: str, listener: str = ""):
+        self.session = session
+        self.speaker = speaker
+        self.listener = listener or peer_role(speaker)
+        self.context = session.context  # History sent with this pipeline's translations
+        self.prompts: asyncio.Queue = asyncio.Queue(maxsize=PROMPT_QUEUE_SIZE)
+        self.turns: asyncio.Queue = asyncio.Queue(maxsize=MAX_TURNS_IN_FLIGHT)
+        self.in_flight: Deque[TranslationTurn] = deque()  # Started and not yet fully sent
+        self.stage_tasks: List[asyncio.Task] = []
+        self.last_partial = ""  # Previous partial transcript of the current utterance
+        self.speculation: Optional[Speculation] = None  # Prefix translation awaiting the final prompt
+        self.awaiting_speech: Deque[TranslationTurn] = deque(maxlen=4)  # Sent, listener's TTS not started yet
+
+    def start(self):
+        if not self.stage_tasks:
+            self.stage_tasks = [
+                asyncio.create_task(self._translator()),
+                asyncio.create_task(self._sender()),
+            ]
+
+    def submit(self, prompt: str):
+        """Reader stage: queue a prompt without blocking the websocket receive loop"""
+        self.start()
+        speculation, self.speculation = self.speculation, None
+        self.last_partial = ""
+        if speculation and not speculation.matches(prompt):
+            speculation.discard()
+            speculation = None
+        if self.prompts.full():
+            dropped, dropped_speculation, _ = self.prompts.get_nowait()
+            if dropped_speculation:
+                dropped_speculation.discard()
+            logging.warning("Prompt queue full for %s in session %s, dropping the oldest prompt",
+                            self.speaker, self.session.session_id)
+            message_log.debug("Dropped prompt: %s", dropped)
+        self.prompts.put_nowait((prompt, speculation, time.monotonic()))
+
+    def submit_partial(self, partial: str):
+        """Reader stage: start translating the stable prefix of a partial transcript"""
+        source_lang, target_lang = self.languages()
+        if source_lang == target_lang:
+            return  # Nothing to translate ahead of time
+        if self.speculation and not partial.startswith(self.speculation.prefix):
+            message_log.debug("Discarding %s speculation, transcript changed: %s", self.speaker, partial)
+            self.speculation.discard()
+            self.speculation = None
+        if not self.speculation:
+            prefix = stable_prefix(partial, self.last_partial)
+            if len(prefix) >= SPECULATION_MIN_CHARS and not self.session.glossary().protect(prefix, source_lang)[1]:
+                self.speculation = Speculation(prefix, source_lang, target_lang, self.session.session_id,
+                                               self.context)
+        self.last_partial = partial
+
+    def cancel_in_flight(self):
+        """Cancel every started turn, e.g. because the listener barged in"""
+        while self.in_flight:
+            self.in_flight.popleft().cancel()
+
+    async def stop(self):
+        self.cancel_in_flight()
+        if self.speculation:
+            self.speculation.discard()
+            self.speculation = None
+        for task in self.stage_tasks:
+            task.cancel()
+        await asyncio.gather(*self.stage_tasks, return_exceptions=True)
+        self.stage_tasks = []
+
+    async def _translator(self):
+        while True:
+            prompt, speculation, received_at = await self.prompts.get()
+            if len(self.in_flight) >= MAX_TURNS_IN_FLIGHT:
+                # A newer utterance supersedes the oldest one still being translated
+                self.in_flight.popleft().cancel()
+            if speculation and not self.speculation_usable(prompt):
+                speculation.discard()
+                speculation = None
+            if speculation:
+                speculation.adopt()
+            turn = TranslationTurn(self.speaker, prompt, speculation)
+            turn.timings["prompt"] = received_at
+            self.predict_wait(turn)
+            turn.task = asyncio.create_task(self._translate(turn))
+            self.in_flight.append(turn)
+            await self.turns.put(turn)  # Backpressure: waits while the sender is behind
+
+    def speculation_usable(self, prompt: str) -> bool:
+        """Whether a speculated prefix can serve `prompt`; glossary matches need the protected prompt instead"""
+        target_lang = self.languages()[1]
+        glossary = self.session.glossary()
+        return glossary.exact_hit(prompt, target_lang) is None and not glossary.protect(prompt, target_lang)[1]
+
+    def languages(self) -> Tuple[str, str]:
+        """Return (spoken language, listener language)"""
+        return self.session.languages_for(self.speaker)
+
+    def listener_websocket(self, turn: Optional[TranslationTurn] = None) -> Optional[WebSocket]:
+        """Where `turn` is sent; None once nobody is left to hear it"""
+        return self.session.websocket_for(self.listener)
+
+    def metric_labels(self) -> Dict[str, str]:
+        source_lang, target_lang = self.languages()
+        return {"pair": f"{source_lang}>{target_lang}", "tts": self.session.tts_provider_for(self.listener)}
+
+    def on_listener_speaking(self, listener: str):
+        """The listener's TTS started playing: the oldest delivered turn reached their ear"""
+        if self.awaiting_speech:
+            self._heard(self.awaiting_speech.popleft())
+
+    def _await_speech(self, turn: TranslationTurn):
+        self.awaiting_speech.append(turn)
+
+    def _heard(self, turn: TranslationTurn):
+        if "heard" not in turn.timings:  # A conference turn counts once, at its first listener's ear
+            turn.timings["heard"] = time.monotonic()
+            turn_mouth_to_ear_seconds.observe(turn.timings["heard"] - turn.timings["prompt"], **self.metric_labels())
+
+    async def _timed(self, turn: TranslationTurn, stream):
+        """Record first/last token times and token counts of a translation stream"""
+        pair = self.metric_labels()["pair"]
+        async for event in stream:
+            if event["token"]:
+                turn.timings.setdefault("first_token", time.monotonic())
+                tokens_total.inc(pair=pair)
+            yield event
+        turn.timings["last_token"] = time.monotonic()
+
+    def _observe(self, turn: TranslationTurn):
+        labels = self.metric_labels()
+        started = turn.timings["prompt"]
+        for stage, histogram in (("llm_start", turn_queue_seconds), ("first_token", turn_first_token_seconds),
+                                 ("first_send", turn_first_send_seconds), ("last_token", turn_last_token_seconds)):
+            if stage in turn.timings:
+                histogram.observe(turn.timings[stage] - started, **labels)
+
+    def predict_wait(self, turn: TranslationTurn):
+        """Predict the turn's wait for its first chunk, unless it is answered without a fresh LLM call"""
+        source_lang, target_lang = self.languages()
+        if source_lang == target_lang or turn.speculation:
+            return
+        if self.session.glossary().exact_hit(turn.prompt, target_lang) is not None:
+            return
+        key = TranslationCache.key(turn.prompt, source_lang, target_lang)
+        if key and translation_cache.contains(key):
+            return
+        turn.expected_ttft = backend_router.expected_ttft()
+        turn.predicted_wait = latency_predictor.predict(f"{source_lang}>{target_lang}",
+                                                        estimate_tokens(turn.prompt), turn.expected_ttft)
+
+    async def _cover_wait(self, turn: TranslationTurn):
+        """Play filler to the listener if the turn's first chunk is predicted to be long in coming"""
+        if turn.predicted_wait is None or not turn.events.empty():
+            return
+        remaining = turn.predicted_wait - (time.monotonic() - turn.timings.get("llm_start", time.monotonic()))
+        websocket = self.listener_websocket(turn)
+        if remaining < FILLER_THRESHOLD or not websocket:
+            fillers_total.inc(outcome="skipped")
+            return
+        fillers_total.inc(outcome="played")
+        await play_filler(websocket, self.languages()[1])
+
+    def _source_stream(self, turn: TranslationTurn):
+        source_lang, target_lang = self.languages()
+        glossary = self.session.glossary()
+        exact = glossary.exact_hit(turn.prompt, target_lang)
+        if exact is not None:
+            glossary_hits_total.inc(kind="utterance")
+            return passthrough_stream(exact)  # The whole utterance is a glossary term: no LLM call
+        text, replacements = glossary.protect(turn.prompt, target_lang)
+        if turn.speculation:
+            # Only adopted when the glossary leaves the prompt alone, see speculation_usable
+            return translate_with_speculation(turn.prompt, turn.speculation, source_lang, target_lang)
+        glossary_hits_total.inc(len(replacements), kind="term")
+        stream = translate_cached(text, source_lang, target_lang, self.session.session_id, self.context)
+        return restore_terms(stream, replacements) if replacements else stream
+
+    async def _translate(self, turn: TranslationTurn):
+        turn.timings["llm_start"] = time.monotonic()
+        stream = self._timed(turn, self._source_stream(turn))
+        if TOKEN_COALESCING:
+            stream = coalesce_tokens(stream)
+        try:
+            async for event in stream:
+                turn.timings.setdefault("first_chunk", time.monotonic())
+                await turn.events.put(event)  # Backpressure: waits while the listener is behind
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logging.error(f"Error translating {self.speaker} turn in session {self.session.session_id}: {e}")
+        await turn.events.put(TURN_END)
+
+    async def _sender(self):
+        while True:
+            turn = await self.turns.get()
+            try:
+                await self._deliver(turn)
+            except Exception as e:
+                logging.error(f"Error sending {self.speaker} turn in session {self.session.session_id}: {e}")
+                turn.cancel()
+            if turn in self.in_flight:
+                self.in_flight.remove(turn)
+
+    def _transcribe(self, turn: TranslationTurn, translated_text: str):
+        source_lang, target_lang = self.languages()
+        started = turn.timings["prompt"]
+        transcript_writer.record(
+            self.session.session_id, "turn", speaker=self.speaker, source_language=source_lang,
+            target_language=target_lang, original=turn.prompt, translation=translated_text.strip(),
+            cancelled=turn.cancelled, speculated=turn.speculation is not None,
+            timings_ms={stage: round((at - started) * 1000, 1) for stage, at in turn.timings.items()},
+        )
+
+    async def _deliver(self, turn: TranslationTurn):
+        source_lang, target_lang = self.languages()
+        translated_text = ""
+        open_utterance = False
+        if self.session.play_waiting_music:
+            await self._cover_wait(turn)
+
+        while True:
+            event = await turn.events.get()
+            if event is TURN_END:
+                break
+            websocket = self.listener_websocket(turn)
+            if not websocket:
+                turn.cancel()
+                return
+            await websocket.send_text(encode_text_event(event))
+            turn.timings.setdefault("first_send", time.monotonic())
+            translated_text += event["token"]
+            open_utterance = not event["last"]
+
+        if open_utterance:
+            await flush_utterance(self.listener_websocket(turn))
+        self._transcribe(turn, translated_text)
+        if turn.cancelled:
+            turns_total.inc(outcome="cancelled")
+            logging.debug("Cancelled %s turn in session %s after: %s", self.speaker, self.session.session_id,
+                          translated_text)
             return
 
-        session = translation_sessions[session_id]
+        turns_total.inc(outcome="completed")
+        self._observe(turn)
+        if turn.predicted_wait is not None and "first_chunk" in turn.timings:
+            latency_predictor.observe(f"{source_lang}>{target_lang}", estimate_tokens(turn.prompt), turn.expected_ttft,
+                                      turn.timings["first_chunk"] - turn.timings["llm_start"])
+        self._await_speech(turn)
+        self.context.append(source_lang, turn.prompt, translated_text.strip())
+        logging.debug("Translated from %s to %s: %s", source_lang, target_lang, translated_text)
+
+class ConferenceLane(TurnPipeline):
+    """A speaker's turns into one listener language of a conference, shared by all its listeners"""
+    def __init__(self, session: ConferenceSession, speaker: str, language: str):
+        super().__init__(session, speaker, listener=language)
+        self.context = session.context_for(language)
+        self.awaiting_listeners: Dict[str, Deque[TranslationTurn]] = {}  # Participant id -> sent, TTS not started yet
+
+    def languages(self) -> Tuple[str, str]:
+        return self.session.participants[self.speaker]["language"], self.listener
+
+    def listener_websocket(self, turn: Optional[TranslationTurn] = None) -> Optional["ListenerGroup"]:
+        return self.session.listener_group(self.speaker, self.listener, turn.skipped if turn else ())
+
+    def on_listener_speaking(self, listener: str):
+        awaiting = self.awaiting_listeners.get(listener)
+        if awaiting:
+            self._heard(awaiting.popleft())
+
+    def _await_speech(self, turn: TranslationTurn):
+        for participant_id, participant in self.session.participants.items():
+            if (participant_id != self.speaker and participant_id not in turn.skipped
+                    and participant["language"] == self.listener):
+                self.awaiting_listeners.setdefault(participant_id, deque(maxlen=4)).append(turn)
+
+    def skip_listener(self, listener: str):
+        """Stop sending the in-flight turns to `listener`, who barged in; the others keep hearing them"""
+        interrupted = False
+        for turn in self.in_flight:
+            turn.skipped.add(listener)
+            interrupted = interrupted or "first_send" in turn.timings
+            if not self.listener_websocket(turn):
+                turn.cancel()  # That was the last listener of this language
+        websocket = self.session.websocket_for(listener)
+        if interrupted and websocket:
+            spawn_background(flush_utterance(websocket))
+
+    def metric_labels(self) -> Dict[str, str]:
+        source_lang, target_lang = self.languages()
+        tts_providers = sorted({participant["tts_provider"] for participant in self.session.participants.values()
+                                if participant["language"] == target_lang})
+        return {"pair": f"{source_lang}>{target_lang}", "tts": ",".join(tts_providers)}
+
+    def _source_stream(self, turn: TranslationTurn):
+        source_lang, target_lang = self.languages()
+        if source_lang == target_lang:
+            return passthrough_stream(turn.prompt)  # Same language: speak the utterance as is
+        return super()._source_stream(turn)
+
+async def passthrough_stream(text: str):
+    yield {"token": text, "type": "text", "last": True}
+
+async def create_twilio_call(**kwargs):
+    """Place a call through the Twilio REST API without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(twilio_executor, functools.partial(twilio_client.calls.create, **kwargs))
+
+async def end_twilio_call(call_sid: Optional[str]):
+    """Hang up or cancel a call through the Twilio REST API"""
+    if not call_sid:
+        return
+    loop = asyncio.get_running_loop()
+    try:
+        await loop.run_in_executor(twilio_executor, functools.partial(
+            twilio_client.calls(call_sid).update, status="completed"))
+    except Exception as e:
+        logging.warning(f"Could not end call {call_sid}: {e}")
+
+async def create_outbound_target_call(session_id: str, host: str, target_number: str, twilio_number: str) -> Optional[str]:
+    """Create outbound call to target language speaker, returning its call SID"""
+    try:
+        # Get existing session and update it
+        session = await translation_sessions.get(session_id)
+        if not session:
+            logging.error(f"Session {session_id} not found!")
+            return None
 
         # Use the host passed from the incoming request
         webhook_url = f"https://{host}/voice/target/{session_id}"
         logging.info(f"Webhook URL for target caller: {webhook_url}")
-        call = twilio_client.calls.create(
+        call = await create_twilio_call(
             to=target_number,
             from_=twilio_number,
             url=webhook_url,
             method="POST",
-            record=True
+            record=True,
+            status_callback=f"https://{host}/call-status/target/{session_id}",
+            status_callback_event=["answered", "completed"],
+            status_callback_method="POST",
+            recording_status_callback=f"https://{host}/recording-status/target/{session_id}",
+            recording_status_callback_method="POST"
         )
 
         # Update session with target call info
         session.target_call_sid = call.sid
+        await translation_sessions.save(session, "target_call_sid")
         logging.info(f"Created outbound call to target number: {call.sid}")
+        return call.sid
 
     except Exception as e:
         logging.error(f"Error creating outbound call: {e}")
+        return None
 
-async def create_outbound_source_call(session_id: str, host: str, source_number: str, twilio_number: str):
-    """Create outbound call to source language speaker"""
+async def create_outbound_source_call(session_id: str, host: str, source_number: str, twilio_number: str) -> Optional[str]:
+    """Create outbound call to source language speaker, returning its call SID"""
     try:
         # Get existing session and update it
-        if session_id not in translation_sessions:
+        session = await translation_sessions.get(session_id)
+        if not session:
             logging.error(f"Session {session_id} not found!")
-            return
-
-        session = translation_sessions[session_id]
+            return None
 
         # Use the host passed from the incoming request
         webhook_url = f"https://{host}/voice/source/{session_id}"
         logging.info(f"Webhook URL for source caller: {webhook_url}")
-        call = twilio_client.calls.create(
+        call = await create_twilio_call(
             to=source_number,
             from_=twilio_number,
             url=webhook_url,
             method="POST",
-            record=True
+            record=True,
+            status_callback=f"https://{host}/call-status/source/{session_id}",
+            status_callback_event=["answered", "completed"],
+            status_callback_method="POST",
+            recording_status_callback=f"https://{host}/recording-status/source/{session_id}",
+            recording_status_callback_method="POST"
         )
 
         # Update session with source call info
         session.source_call_sid = call.sid
+        await translation_sessions.save(session, "source_call_sid")
         logging.info(f"Created outbound call to source number: {call.sid}")
+        return call.sid
 
     except Exception as e:
         logging.error(f"Error creating outbound source call: {e}")
+        return None
+
+async def create_translation_session(host: str, from_number: str, to_number: str, source_language: str,
+                                           target_language: str, source_tts_provider: str = "ElevenLabs",
+                                     source_voice: str = "", target_tts_provider: str = "ElevenLabs",
+                                     target_voice: str = "", play_waiting_music: bool = False,
+                                     speculative_translation: bool = SPECULATIVE_TRANSLATION,
+                                     glossary: Optional[Dict[str, object]] = None) -> TranslationSession:
+    """Create and register a translation session for a pair of phone numbers"""
+    # Create unique session ID (bulk requests may repeat a number pair within a second)
+    base_id = f"session_{int(time.time())}_{from_number.replace('+', '')}_{to_number.replace('+', '')}"
+    session_id = base_id
+    suffix = 1
+    while await translation_sessions.get(session_id):
+        suffix += 1
+        session_id = f"{base_id}_{suffix}"
+
+    session = TranslationSession(session_id, "")
+    session.source_phone_number = from_number
+    session.target_phone_number = to_number
+    session.source_language = source_language
+    session.target_language = target_language
+    session.source_tts_provider = source_tts_provider
+    session.source_voice = source_voice
+    session.target_tts_provider = target_tts_provider
+    session.target_voice = target_voice
+    session.host = host
+    session.play_waiting_music = play_waiting_music  # Set the flag
+    session.speculative_translation = speculative_translation
+    session.glossary_entries = glossary or {}
+    await translation_sessions.add(session)
+    await session_lifecycle.transition(session, "dialing")
+    transcript_writer.record(session_id, "start", source_language=source_language, target_language=target_language)
+
+    logging.info(f"Created manual translation session: {session_id}")
+    logging.info(f"From: {from_number} ({source_language}) -> To: {to_number} ({target_language})")
+    logging.info(f"Source TTS: {source_tts_provider}/{source_voice}, Target TTS: {target_tts_provider}/{target_voice}")
+    return session
+
+async def warm_llm_connections():
+    """Load litellm and open a pooled connection to each backend, so the next turn skips TLS setup"""
+    await asyncio.to_thread(load_litellm)
+    now = time.monotonic()
+    backends = [backend for backend in backend_router.backends
+                if backend.params.get("api_base") and now - backend.warmed_at > LLM_KEEPALIVE / 2]
+    for backend in backends:
+        backend.warmed_at = now
+
+    async def connect(backend: TranslationBackend):
+        try:
+            # Any response leaves an open connection in the pool
+            await llm_http_client.head(backend.params["api_base"])
+        except Exception as e:
+            backend.warmed_at = float("-inf")
+            logging.warning(f"Could not warm connection to translation backend {backend.name}: {e}")
+
+    await asyncio.gather(*(connect(backend) for backend in backends))
+
+async def warm_session(languages: List[str]):
+    """Warm LLM connections and the session's system phrases while its phones ring"""
+    await asyncio.gather(
+        warm_llm_connections(),
+        *(phrase_catalog.get(phrase_key, language) for language in languages for phrase_key in SYSTEM_PHRASES),
+        return_exceptions=True,
+    )
+
+async def dial_session(session: TranslationSession) -> Tuple[Optional[str], Optional[str]]:
+    """Dial both legs of a session concurrently, returning (source, target) call SIDs"""
+    spawn_background(warm_session([session.source_language, session.target_language]))
+    source_sid, target_sid = await asyncio.gather(
+        create_outbound_source_call(session.session_id, session.host, session.source_phone_number, twilio_number),
+        create_outbound_target_call(session.session_id, session.host, session.target_phone_number, twilio_number),
+    )
+    if not (source_sid and target_sid):
+        # Without both legs there is no conversation; hang up the one that was placed
+        await cleanup_session(session.session_id)
+    return source_sid, target_sid
+
+async def create_conference_session(host: str, participants: List[dict],
+                                    speculative_translation: bool = SPECULATIVE_TRANSLATION,
+                                    glossary: Optional[Dict[str, object]] = None) -> ConferenceSession:
+    """Create and register a conference for participants given as phone_number/language/tts_provider/voice"""
+    base_id = f"conference_{int(time.time())}_{participants[0]['phone_number'].replace('+', '')}"
+    session_id = base_id
+    suffix = 1
+    while await translation_sessions.get(session_id):
+        suffix += 1
+        session_id = f"{base_id}_{suffix}"
+
+    session = ConferenceSession(session_id)
+    for participant in participants:
+        session.add_participant(participant["phone_number"], participant["language"],
+                                participant.get("tts_provider", "ElevenLabs"), participant.get("voice", ""))
+    session.host = host
+    session.speculative_translation = speculative_translation
+    session.glossary_entries = glossary or {}
+    await translation_sessions.add(session)
+    await session_lifecycle.transition(session, "dialing")
+    transcript_writer.record(session_id, "start", participants=session.participants)
+
+    languages = sorted({participant["language"] for participant in session.participants.values()})
+    logging.info(f"Created conference session {session_id}: {len(participants)} participants, languages {languages}")
+    return session
+
+async def create_participant_call(session: ConferenceSession, participant_id: str) -> Optional[str]:
+    """Dial one conference participant, returning the call SID"""
+    participant = session.participants[participant_id]
+    try:
+        call = await create_twilio_call(
+            to=participant["phone_number"],
+            from_=twilio_number,
+            url=f"https://{session.host}/voice/conference/{session.session_id}/{participant_id}",
+            method="POST",
+            record=True,
+            status_callback=f"https://{session.host}/call-status/{participant_id}/{session.session_id}",
+            status_callback_event=["answered", "completed"],
+            status_callback_method="POST",
+            recording_status_callback=f"https://{session.host}/recording-status/{participant_id}/{session.session_id}",
+            recording_status_callback_method="POST"
+        )
+        participant["call_sid"] = call.sid
+        logging.info(f"Created call to conference participant {participant_id}: {call.sid}")
+        return call.sid
+    except Exception as e:
+        logging.error(f"Error creating call to conference participant {participant_id}: {e}")
+        participant["call_status"] = "failed"
+        return None
+
+async def dial_conference(session: ConferenceSession) -> Dict[str, Optional[str]]:
+    """Dial every participant concurrently, returning participant id -> call SID"""
+    spawn_background(warm_session(sorted({participant["language"] for participant in session.participants.values()})))
+    call_sids = await asyncio.gather(*(create_participant_call(session, participant_id)
+                                       for participant_id in session.participants))
+    await translation_sessions.save(session, *(f"participants.{participant_id}.{key}"
+                                               for participant_id in session.participants
+                                               for key in ("call_sid", "call_status")))
+    if sum(1 for call_sid in call_sids if call_sid) < 2:
+        await cleanup_session(session.session_id)
+    return dict(zip(session.participants, call_sids))
+
+async def check_conference_readiness(session: ConferenceSession, participant_id: str):
+    """Greet a participant who joined: music while alone, "ready" once someone else is on the line"""
+    connected = session.connected()
+    websocket = session.websocket_for(participant_id)
+    if len(connected) < 2:
+        await session_lifecycle.transition(session, "waiting")
+        # Someone who has answered connects within moments; only play music if everyone else is ringing
+        if not any(other in session.answered for other in session.participants if other != participant_id):
+            await play_wait_music(websocket)
+        return
+    await session_lifecycle.transition(session, "active")
+    # The first participant has been waiting alone and hears "ready" together with the second
+    greet = connected if len(connected) == 2 else [participant_id]
+    # Two setups that finished together both see the pair connected; greet each participant once
+    greet = [greeted for greeted in greet if greeted not in session.greeted]
+    session.greeted.update(greet)
+    await asyncio.gather(*(send_system_phrase(session.websocket_for(greeted), "ready",
+                                              session.participants[greeted]["language"])
+                           for greeted in greet))
+
+async def leave_conference(session_id: str, participant_id: str):
+    """Detach a participant who hung up; the conference ends when nobody is left"""
+    if session_lifecycle.state(session_id) == "draining":
+        return
+    session = await translation_sessions.get(session_id)
+    if participant_id not in getattr(session, "participants", {}):
+        return
+    await session.stop_lanes(participant_id)
+    await translation_sessions.detach_websocket(session, participant_id)
+    session.participants[participant_id]["call_status"] = "completed"
+    await translation_sessions.save(session, f"participants.{participant_id}.call_status")
+    transcript_writer.record(session_id, "leave", participant=participant_id)
+    connected = session.connected()
+    logging.info(f"Participant {participant_id} left conference {session_id}, {len(connected)} still connected")
+    if not connected:
+        await cleanup_session(session_id)
+    elif len(connected) == 1:
+        await session_lifecycle.transition(session, "waiting")
 
 @app.websocket("/ws/source/{session_id}")
 async def source_websocket_endpoint(websocket: WebSocket, session_id: str):
     """WebSocket endpoint for source language callers"""
+    current_session_id.set(session_id)
     await websocket.accept()
     call_sid: Optional[str] = None
 
@@ -283,50 +2869,52 @@ async def source_websocket_endpoint(websocket: WebSocket, session_id: str):
         while True:
             data = await websocket.receive_text()
             message = json.loads(data)
-            logging.info(f"Source WebSocket Message: {message}")
+            message_log.debug("Source WebSocket message: %s", message)
 
             if message["type"] == "setup":
                 call_sid = message["callSid"]
                 logging.info(f"Source setup initiated for call SID: {call_sid}")
 
                 # Update session with source WebSocket
-                if session_id in translation_sessions:
-                    session = translation_sessions[session_id]
-                    session.source_websocket = websocket
+                session = await translation_sessions.get(session_id)
+                if session:
+                    await translation_sessions.attach_websocket(session, "source", websocket)
 
                     if not await check_session_readiness_and_notify(session, session_id):
                         continue  # Skip this prompt if not ready
 
             if message["type"] == "prompt":
                 prompt = message["voicePrompt"]
-                logging.info(f"Source prompt: {prompt}")
+                partial = not message.get("last", True)
+                if not partial:
+                    logging.debug("Source prompt: %s", prompt)
 
-                # Get session for language configuration
-                if session_id in translation_sessions:
-                    session = translation_sessions[session_id]
-                    source_lang = session.source_language
-                    target_lang = session.target_language
+                session = await translation_sessions.get(session_id)
+                if session:
 
-                    if not session.target_websocket:
+                    if not session.websocket_for("target"):
                         continue  # Skip this prompt if not ready
 
-                    # Translate using streaming
-                    translated_text = ""
-                    async for event in translate_text_streaming(prompt, source_lang, target_lang):
-                        await session.target_websocket.send_json(event)
-                        translated_text += event["token"]
-
-                    logging.info(f"Translated from {source_lang} to {target_lang}: {translated_text}")
-
-                    # Play music while waiting for the response (if enabled)
-                    if session.play_waiting_music:
-                        await play_waiting_music(session.source_websocket)
+                    # Hand off to the pipeline so this loop keeps reading
+                    if partial:
+                        session.pipeline_for("source").submit_partial(prompt)
+                    else:
+                        session.pipeline_for("source").submit(prompt)
 
             if message["type"] == "info":
-                logging.info(f"Source info: {message}")
+                message_log.debug("Source info: %s", message)
+                # Speaker events: our TTS started playing on this leg, so the peer's turn was heard
+                if message.get("name") == "agentSpeaking" and message.get("value") == "on":
+                    session = await translation_sessions.get(session_id)
+                    if session:
+                        session.listener_speaking("source")
 
             if message["type"] == "interrupt":
-                logging.info("Source interrupted")
+                message_log.debug("Source interrupted: %s", message.get("utteranceUntilInterrupt", ""))
+                # The source caller barged in on the translation of the target's speech
+                session = await translation_sessions.get(session_id)
+                if session:
+                    session.cancel_turns("target")
 
             if message["type"] == "error":
                 logging.error("Source WebSocket error")
@@ -340,6 +2928,7 @@ async def source_websocket_endpoint(websocket: WebSocket, session_id: str):
 @app.websocket("/ws/target/{session_id}")
 async def target_websocket_endpoint(websocket: WebSocket, session_id: str):
     """WebSocket endpoint for target language callers"""
+    current_session_id.set(session_id)
     await websocket.accept()
     call_sid: Optional[str] = None
 
@@ -347,17 +2936,18 @@ async def target_websocket_endpoint(websocket: WebSocket, session_id: str):
         while True:
             data = await websocket.receive_text()
             message = json.loads(data)
-            # logging.info(f"Target WebSocket Message: {message}")
+            message_log.debug("Target WebSocket message: %s", message)
 
             if message["type"] == "setup":
                 call_sid = message["callSid"]
                 logging.info(f"Target ws setup initiated for call SID: {call_sid}")
 
                 # Update session with target WebSocket
-                if session_id in translation_sessions:
-                    session = translation_sessions[session_id]
+                session = await translation_sessions.get(session_id)
+                if session:
                     session.target_call_sid = call_sid
-                    session.target_websocket = websocket
+                    await translation_sessions.attach_websocket(session, "target", websocket)
+                    await translation_sessions.save(session, "target_call_sid")
 
                     if not await check_session_readiness_and_notify(session, session_id):
                         continue  # Skip this prompt if not ready
@@ -365,33 +2955,36 @@ async def target_websocket_endpoint(websocket: WebSocket, session_id: str):
             if message["type"] == "prompt":
                 # Phase 2: Translate target back to source
                 prompt = message["voicePrompt"]
-                logging.info(f"Target prompt: {prompt}")
+                partial = not message.get("last", True)
+                if not partial:
+                    logging.debug("Target prompt: %s", prompt)
 
-                if session_id in translation_sessions:
-                    session = translation_sessions[session_id]
-                    target_lang = session.target_language
-                    source_lang = session.source_language
+                session = await translation_sessions.get(session_id)
+                if session:
 
-                    if not session.source_websocket:
+                    if not session.websocket_for("source"):
                         continue  # Skip this prompt if not ready
 
-                    # Translate target → source
-                    translated_text = ""
-                    async for event in translate_text_streaming(prompt, target_lang, source_lang):
-                        await session.source_websocket.send_json(event)
-                        translated_text += event["token"]
-
-                    logging.info(f"Translated from {target_lang} to {source_lang}: {translated_text}")
-
-                    # Play music while waiting for the response
-                    if session.play_waiting_music:
-                        await play_waiting_music(session.target_websocket)
+                    # Translate target → source through the pipeline
+                    if partial:
+                        session.pipeline_for("target").submit_partial(prompt)
+                    else:
+                        session.pipeline_for("target").submit(prompt)
 
             if message["type"] == "info":
-                logging.info(f"Target info: {message}")
+                message_log.debug("Target info: %s", message)
+                # Speaker events: our TTS started playing on this leg, so the peer's turn was heard
+                if message.get("name") == "agentSpeaking" and message.get("value") == "on":
+                    session = await translation_sessions.get(session_id)
+                    if session:
+                        session.listener_speaking("target")
 
             if message["type"] == "interrupt":
-                logging.warning("Target interrupted")
+                message_log.debug("Target interrupted: %s", message.get("utteranceUntilInterrupt", ""))
+                # The target caller barged in on the translation of the source's speech
+                session = await translation_sessions.get(session_id)
+                if session:
+                    session.cancel_turns("source")
 
             if message["type"] == "error":
                 logging.error("Target WebSocket error")
@@ -403,6 +2996,88 @@ async def target_websocket_endpoint(websocket: WebSocket, session_id: str):
         logging.info("Target client disconnected.")
 
 
+@app.websocket("/ws/conference/{session_id}/{participant_id}")
+async def conference_websocket_endpoint(websocket: WebSocket, session_id: str, participant_id: str):
+    """WebSocket endpoint for conference participants"""
+    current_session_id.set(session_id)
+    await websocket.accept()
+
+    try:
+        while True:
+            data = await websocket.receive_text()
+            message = json.loads(data)
+
+            session = await translation_sessions.get(session_id)
+            if not session:
+                continue
+            if participant_id not in getattr(session, "participants", {}):
+                logging.error(f"Unknown participant {participant_id} in conference {session_id}")
+                break
+
+            if message["type"] == "setup":
+                logging.info(f"Conference participant {participant_id} setup for call SID: {message['callSid']}")
+                session.participants[participant_id]["call_sid"] = message["callSid"]
+                await translation_sessions.attach_websocket(session, participant_id, websocket)
+                await translation_sessions.save(session, f"participants.{participant_id}.call_sid")
+                await check_conference_readiness(session, participant_id)
+
+            if message["type"] == "prompt":
+                prompt = message["voicePrompt"]
+                partial = not message.get("last", True)
+                if not partial:
+                    logging.debug("Conference participant %s prompt: %s", participant_id, prompt)
+                # One lane per listener language; each translates once for everyone speaking it
+                for lane in session.lanes_for(participant_id):
+                    if partial:
+                        lane.submit_partial(prompt)
+                    else:
+                        lane.submit(prompt)
+
+            if message["type"] == "info":
+                message_log.debug("Conference participant %s info: %s", participant_id, message)
+                # Speaker events: our TTS started playing for this participant, so a lane's turn was heard
+                if message.get("name") == "agentSpeaking" and message.get("value") == "on":
+                    session.listener_speaking(participant_id)
+
+            if message["type"] == "interrupt":
+                message_log.debug("Conference participant %s interrupted: %s", participant_id,
+                                  message.get("utteranceUntilInterrupt", ""))
+                session.cancel_turns_to(participant_id)
+
+            if message["type"] == "error":
+                logging.error(f"Conference participant {participant_id} WebSocket error")
+
+    except Exception as e:
+        logging.error(f"Conference WebSocket error: {e}")
+    finally:
+        await leave_conference(session_id, participant_id)
+        logging.info(f"Conference participant {participant_id} disconnected.")
+
+@app.post("/voice/conference/{session_id}/{participant_id}")
+async def conference_voice_webhook(request: Request, session_id: str, participant_id: str):
+    """Handle outbound conference participant calls"""
+    form_data = await request.form()
+    logging.info(f"Conference call to participant {participant_id} with SID: {form_data.get('CallSid')}, "
+                 f"Status: {form_data.get('CallStatus')}")
+
+    host = request.headers.get('host')
+    participant = {}
+    partial_prompts = False
+    session = await translation_sessions.get(session_id)
+    if session:
+        participant = getattr(session, "participants", {}).get(participant_id, {})
+        partial_prompts = session.speculative_translation
+
+    twiml = generate_conversation_relay_twiml(
+        ws_url=f"wss://{host}/ws/conference/{session_id}/{participant_id}",
+        language=participant.get("language", ""),
+        tts_provider=participant.get("tts_provider", ""),
+        voice=participant.get("voice", ""),
+        partial_prompts=partial_prompts
+    )
+
+    return Response(content=twiml, media_type="text/xml")
+
 @app.post("/voice/target/{session_id}")
 async def target_voice_webhook(request: Request, session_id: str):
     """Handle outbound target language calls"""
@@ -423,18 +3098,21 @@ async def target_voice_webhook(request: Request, session_id: str):
     target_language = ""
     target_tts_provider = ""
     target_voice = ""
-    if session_id in translation_sessions:
-        session = translation_sessions[session_id]
+    partial_prompts = False
+    session = await translation_sessions.get(session_id)
+    if session:
         target_language = session.target_language
         target_tts_provider = session.target_tts_provider
         target_voice = session.target_voice
+        partial_prompts = session.speculative_translation
 
    # Generate TwiML response using the new function
     twiml = generate_conversation_relay_twiml(
         ws_url=ws_url,
         language=target_language,
         tts_provider=target_tts_provider,
-        voice=target_voice
+        voice=target_voice,
+        partial_prompts=partial_prompts
     )
 
     return Response(content=twiml, media_type="text/xml")
@@ -459,22 +3137,208 @@ async def source_voice_webhook(request: Request, session_id: str):
     source_language = ""  # default
     source_tts_provider = ""  # default
     source_voice = ""  # default
-    if session_id in translation_sessions:
-        session = translation_sessions[session_id]
+    partial_prompts = False  # default
+    session = await translation_sessions.get(session_id)
+    if session:
         source_language = session.source_language
         source_tts_provider = session.source_tts_provider
         source_voice = session.source_voice
+        partial_prompts = session.speculative_translation
 
      # Generate TwiML response using the new function
     twiml = generate_conversation_relay_twiml(
         ws_url=ws_url,
         language=source_language,
         tts_provider=source_tts_provider,
-        voice=source_voice
+        voice=source_voice,
+        partial_prompts=partial_prompts
     )
 
     return Response(content=twiml, media_type="text/xml")
 
+@app.post("/call-status/{role}/{session_id}")
+async def call_status_callback(request: Request, role: str, session_id: str):
+    """Handle Twilio call progress events, ending the session when a leg cannot take part"""
+    form_data = await request.form()
+    call_status = form_data.get("CallStatus")
+    logging.info(f"{role.capitalize()} call {form_data.get('CallSid')} for session {session_id}: {call_status}")
+
+    session = await translation_sessions.get(session_id)
+    if call_status == "in-progress" and session:
+        if role not in session.answered:
+            session.answered[role] = time.time()
+            await translation_sessions.save(session, f"answered.{role}")
+
+    if call_status in FAILED_CALL_STATUSES and session:
+        if isinstance(session, ConferenceSession) and role in session.participants:
+            session.participants[role]["call_status"] = call_status
+            await translation_sessions.save(session, f"participants.{role}.call_status")
+            remaining = [participant for participant in session.participants.values()
+                         if participant["call_status"] not in FAILED_CALL_STATUSES]
+            if len(remaining) >= 2:
+                return Response(status_code=204)  # The others carry on without this participant
+        logging.info(f"{role.capitalize()} leg of session {session_id} ended ({call_status}), cleaning up")
+        spawn_background(cleanup_session(session_id))
+    return Response(status_code=204)
+
+@app.post("/recording-status/{role}/{session_id}")
+async def recording_status_callback(request: Request, role: str, session_id: str):
+    """Attach a finished Twilio call recording to the session's transcript"""
+    form_data = await request.form()
+    if form_data.get("RecordingStatus") == "completed":
+        transcript_writer.record(
+            session_id, "recording", role=role, recording_sid=form_data.get("RecordingSid"),
+            url=form_data.get("RecordingUrl"), duration=int(form_data.get("RecordingDuration") or 0),
+        )
+    return Response(status_code=204)
+
+@app.on_event("startup")
+async def warm_phrase_catalog():
+    """Pre-translate system phrases in the background so session joins skip the LLM"""
+    spawn_background(phrase_catalog.warm(PHRASE_WARM_LANGUAGES))
+
+@app.on_event("startup")
+async def start_session_relay():
+    """Forward peer websocket sends relayed by other workers (no-op for the in-memory store)"""
+    spawn_background(translation_sessions.run_relay())
+
+@app.on_event("startup")
+async def start_transcript_writer():
+    """Write queued transcript records in the background"""
+    spawn_background(transcript_writer.run())
+
+@app.on_event("startup")
+async def start_session_reaper():
+    """Tear down sessions that never connect, never get a peer, or outstay their limits"""
+    spawn_background(session_lifecycle.run())
+
+@app.on_event("startup")
+async def install_drain_handler():
+    """Let calls on this worker finish when it is asked to stop"""
+    worker_drain.install()
+
+@app.on_event("startup")
+async def preload_llm_client():
+    """Import litellm and connect to the backends in the background once the worker is serving"""
+    spawn_background(warm_llm_connections())
+
+@app.on_event("shutdown")
+async def close_llm_client():
+    await llm_http_client.aclose()
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus-style metrics for this worker"""
+    local_sessions = translation_sessions.values()
+    in_flight = sum(len(pipeline.in_flight) for session in local_sessions for pipeline in session.pipelines.values())
+    lines = []
+    lines += render_gauge("translation_sessions", "Translation sessions in the session store",
+                          await translation_sessions.count())
+    lines += render_gauge("translation_sessions_local", "Sessions with a websocket on this worker", len(local_sessions))
+    lines += render_gauge("translation_turns_in_flight", "Turns being translated or sent", in_flight)
+    lines += ["# HELP translation_sessions_by_state Sessions tracked by this worker's lifecycle reaper",
+              "# TYPE translation_sessions_by_state gauge"]
+    lines += [f'translation_sessions_by_state{{state="{state}"}} {count}'
+              for state, count in session_lifecycle.counts().items()]
+    lines += render_gauge("translation_worker_draining", "Whether this worker is draining after SIGTERM", int(worker_drain.draining))
+    lines += render_gauge("translation_lifecycle_timers", "Entries in the reaper's deadline heap", len(session_lifecycle.heap))
+    lines += sessions_reaped_total.render()
+    lines += glossary_hits_total.render()
+    lines += fillers_total.render()
+    lines += render_gauge("translation_transcript_queued", "Transcript records waiting for the writer", transcript_writer.queue.qsize())
+    lines += render_gauge("translation_transcript_dropped", "Transcript records dropped because the queue was full", transcript_writer.dropped)
+    lines += render_gauge("process_resident_memory_bytes", "Resident memory of this worker", resident_memory_bytes())
+    for histogram in (turn_queue_seconds, turn_first_token_seconds, turn_first_send_seconds,
+                      turn_last_token_seconds, turn_mouth_to_ear_seconds):
+        lines += histogram.render()
+    lines += turns_total.render()
+    lines += tokens_total.render()
+    lines += render_gauge("translation_llm_scheduler_queued", "LLM calls waiting for rate budget", llm_scheduler.queued())
+    lines += llm_wait_seconds.render()
+    lines += sessions_rejected_total.render()
+    lines += llm_hedges_total.render()
+    lines += llm_errors_total.render()
+    lines += ["# HELP translation_llm_ttft_seconds Rolling time to first token per backend",
+              "# TYPE translation_llm_ttft_seconds gauge"]
+    lines += [f'translation_llm_ttft_seconds{{backend="{backend.name}"}} {backend.ttft or 0.0}'
+              for backend in backend_router.backends]
+    lines += ["# HELP translation_llm_backend_healthy Whether the backend's circuit breaker is closed",
+              "# TYPE translation_llm_backend_healthy gauge"]
+    lines += [f'translation_llm_backend_healthy{{backend="{backend.name}"}} {int(backend.healthy())}'
+              for backend in backend_router.backends]
+    for name, value in translation_cache.stats().items():
+        lines += render_gauge(f"translation_cache_{name}", f"Translation cache {name}", value)
+    for name, value in speculation_stats.items():
+        lines += render_gauge(f"translation_speculation_{name}", f"Speculative translation {name}", value)
+    return PlainTextResponse("\n".join(lines) + "\n", media_type="text/plain; version=0.0.4")
+
+@app.get("/health/live")
+async def liveness():
+    """The worker's event loop is responding"""
+    return JSONResponse(content={"status": "ok"})
+
+@app.get("/health/ready")
+async def readiness():
+    """Whether this worker should be sent new calls"""
+    if worker_drain.draining:
+        return JSONResponse(content={"status": "draining", "sessions": len(translation_sessions.values())},
+                            status_code=503)
+    return JSONResponse(content={"status": "ready"})
+
+@app.get("/log-level")
+async def get_log_level():
+    """Report the default log level and per-session overrides"""
+    return JSONResponse(content={session_id or "default": logging.getLevelName(level)
+                                 for session_id, level in log_levels.items()})
+
+@app.post("/log-level")
+async def update_log_level(request: Request):
+    """Change the log level at runtime.
+
+    Body: {"level": "DEBUG", optional "session_id"}; a null level removes a session's override.
+    """
+    body = await request.json()
+    level = body.get("level")
+    session_id = body.get("session_id", "")
+    if level is not None:
+        level = logging.getLevelName(str(level).upper())
+        if not isinstance(level, int):
+            return JSONResponse(content={"status": "error", "message": f"Unknown log level {body['level']}"},
+                                status_code=400)
+    elif not session_id:
+        return JSONResponse(content={"status": "error", "message": "The default level cannot be removed"},
+                            status_code=400)
+    set_log_level(level, session_id)
+    logging.warning(f"Log level for {session_id or 'all sessions'} set to {body.get('level')}")
+    return await get_log_level()
+
+@app.get("/speculation-stats")
+async def get_speculation_stats():
+    """Report how much latency speculative translation saved and how many tokens it wasted"""
+    adopted = speculation_stats["hits"]
+    return JSONResponse(content={
+        **speculation_stats,
+        "avg_saved_ms": speculation_stats["saved_ms"] / adopted if adopted else 0.0,
+    })
+
+@app.get("/translation-cache-stats")
+async def get_translation_cache_stats():
+    """Report hit, miss and eviction counters of the cross-session translation cache"""
+    return JSONResponse(content=translation_cache.stats())
+
+@app.get("/transcripts/{session_id}")
+async def get_transcript(session_id: str):
+    """Return a session's bilingual transcript: its turns in order plus call recordings"""
+    records = await transcript_writer.read(session_id)
+    if records is None:
+        return JSONResponse(content={"status": "error", "message": "Transcript not found"}, status_code=404)
+    return JSONResponse(content={
+        "session_id": session_id,
+        "finished": any(record["event"] == "end" for record in records),
+        "turns": [record for record in records if record["event"] == "turn"],
+        "recordings": [record for record in records if record["event"] == "recording"],
+    })
+
 @app.get("/")
 async def call_form():
     """Serve HTML form for initiating translation calls"""
@@ -493,6 +3357,7 @@ async def initiate_call(request: Request):
     target_tts_provider = form_data.get("target_tts_provider", "ElevenLabs")
     target_voice = form_data.get("target_voice", "")
     play_waiting_music = form_data.get("play_waiting_music") == "on"  # Checkbox value
+    speculative_translation = form_data.get("speculative_translation", "on" if SPECULATIVE_TRANSLATION else "off") == "on"
 
     # Validate required fields
     if not all([from_number, to_number, source_language, target_language]):
@@ -500,9 +3365,32 @@ async def initiate_call(request: Request):
             content="<h1>Error: All fields are required</h1><a href='/'>Go back</a>",
             status_code=400
         )
+    try:
+        glossary = parse_glossary(form_data.get("glossary", ""))
+    except ValueError as e:
+        return HTMLResponse(
+            content=f"<h1>Error: Invalid glossary: {e}</h1><a href='/'>Go back</a>",
+            status_code=400
+        )
+
+    if worker_drain.draining:
+        return HTMLResponse(
+            content="<h1>Error: This server is restarting, please try again shortly</h1><a href='/'>Go back</a>",
+            status_code=503,
+            headers={"Retry-After": "5"}
+        )
+
+    # Refuse new sessions rather than slowing down the ones already talking
+    if llm_scheduler.saturated():
+        sessions_rejected_total.inc()
+        logging.warning(f"Rejecting new session: {llm_scheduler.queued()} LLM calls waiting")
+        return HTMLResponse(
+            content="<h1>Error: The service is busy, please try again shortly</h1><a href='/'>Go back</a>",
+            status_code=503,
+            headers={"Retry-After": "5"}
+        )
 
     # Get Twilio phone number from environment
-    twilio_number = "+14432251592"
     if not twilio_number:
         return HTMLResponse(
             content="<h1>Error: Twilio phone number not configured</h1><a href='/'>Go back</a>",
@@ -510,37 +3398,20 @@ async def initiate_call(request: Request):
         )
 
     try:
-        # Create unique session ID
-        session_id = f"session_{int(time.time())}_{from_number.replace('+', '')}_{to_number.replace('+', '')}"
-
-        # Create translation session
-        session = TranslationSession(session_id, "")
-        session.source_phone_number = from_number
-        session.target_phone_number = to_number
-        session.source_language = source_language
-        session.target_language = target_language
-        session.source_tts_provider = source_tts_provider
-        session.source_voice = source_voice
-        session.target_tts_provider = target_tts_provider
-        session.target_voice = target_voice
-        session.host = request.headers.get('host')
-        session.play_waiting_music = play_waiting_music  # Set the flag
-        translation_sessions[session_id] = session
-
-        logging.info(f"Created manual translation session: {session_id}")
-        logging.info(f"From: {from_number} ({source_language}) -> To: {to_number} ({target_language})")
-        logging.info(f"Source TTS: {source_tts_provider}/{source_voice}, Target TTS: {target_tts_provider}/{target_voice}")
+        session = await create_translation_session(
+            request.headers.get('host'), from_number, to_number, source_language, target_language,
+            source_tts_provider, source_voice, target_tts_provider, target_voice,
+            play_waiting_music, speculative_translation, glossary,
+        )
 
         # Create outbound calls to both parties
-        await create_outbound_source_call(session_id, session.host, from_number, twilio_number)
-        await create_outbound_target_call(session_id, session.host, to_number, twilio_number)
-
+        await dial_session(session)
 
         return JSONResponse(
             content={
                 "status": "success",
                 "message": "call started successfully",
-                "session_id": session_id,
+                "session_id": session.session_id,
                 "from_number": from_number,
                 "to_number": to_number,
                 "source_language": source_language,
@@ -556,5 +3427,139 @@ async def initiate_call(request: Request):
             status_code=500
         )
     
+def json_fields_error(entry: object, required: Tuple[str, ...], strings: Tuple[str, ...] = (),
+                      flags: Tuple[str, ...] = ()) -> Optional[str]:
+    """Describe what is wrong with one object of a JSON request body, or return None if it is usable"""
+    if not isinstance(entry, dict):
+        return "Expected a JSON object"
+    if not all(entry.get(field) for field in required):
+        return f"{', '.join(required)} are required"
+    for field in required + strings:
+        if field in entry and not isinstance(entry[field], str):
+            return f"{field} must be a string"
+    for field in flags:
+        if field in entry and not isinstance(entry[field], bool):
+            return f"{field} must be true or false"
+    return None
+
+@app.post("/initiate-calls")
+async def initiate_calls(request: Request):
+    """Start many translation sessions from one JSON request.
+
+    Body: {"sessions": [{"from_number", "to_number", "source_language", "target_language",
+    optional "source_tts_provider", "source_voice", "target_tts_provider", "target_voice",
+    "play_waiting_music", "speculative_translation", "glossary"}, ...]}
+    """
+    try:
+        entries = (await request.json())["sessions"]
+    except Exception:
+        entries = None
+    if not isinstance(entries, list):
+        return JSONResponse(content={"status": "error", "message": "Expected a JSON body with a sessions list"},
+                            status_code=400)
+    if len(entries) > BULK_MAX_SESSIONS:
+        return JSONResponse(content={"status": "error", "message": f"At most {BULK_MAX_SESSIONS} sessions per request"},
+                            status_code=400)
+
+    if worker_drain.draining:
+        return JSONResponse(content={"status": "error", "message": "This server is restarting, please try again shortly"},
+                            status_code=503, headers={"Retry-After": "5"})
+    if llm_scheduler.saturated():
+        sessions_rejected_total.inc(len(entries))
+        return JSONResponse(content={"status": "error", "message": "The service is busy, please try again shortly"},
+                            status_code=503, headers={"Retry-After": "5"})
+
+    host = request.headers.get('host')
+    results: List[Optional[dict]] = [None] * len(entries)
+    sessions: List[Tuple[int, TranslationSession]] = []
+    for index, entry in enumerate(entries):
+        error = json_fields_error(entry, ("from_number", "to_number", "source_language", "target_language"),
+                                  ("source_tts_provider", "source_voice", "target_tts_provider", "target_voice"),
+                                  ("play_waiting_music", "speculative_translation"))
+        if error:
+            results[index] = {"status": "error", "message": error}
+            continue
+        required = [entry[field] for field in ("from_number", "to_number", "source_language", "target_language")]
+        try:
+            glossary = parse_glossary(entry.get("glossary"))
+        except ValueError as e:
+            results[index] = {"status": "error", "message": f"Invalid glossary: {e}"}
+            continue
+        session = await create_translation_session(
+            host, *required,
+            source_tts_provider=entry.get("source_tts_provider", "ElevenLabs"),
+            source_voice=entry.get("source_voice", ""),
+            target_tts_provider=entry.get("target_tts_provider", "ElevenLabs"),
+            target_voice=entry.get("target_voice", ""),
+            play_waiting_music=entry.get("play_waiting_music", False),
+            speculative_translation=entry.get("speculative_translation", SPECULATIVE_TRANSLATION),
+            glossary=glossary,
+        )
+        sessions.append((index, session))
+
+    # Every leg of every session is dialed concurrently, bounded by the Twilio thread pool
+    call_sids = await asyncio.gather(*(dial_session(session) for _, session in sessions))
+    for (index, session), (source_sid, target_sid) in zip(sessions, call_sids):
+        results[index] = {
+            "status": "success" if source_sid and target_sid else "error",
+            "session_id": session.session_id,
+            "source_call_sid": source_sid,
+            "target_call_sid": target_sid,
+        }
+
+    started = sum(1 for result in results if result["status"] == "success")
+    logging.info(f"Bulk request started {started}/{len(entries)} translation sessions")
+    return JSONResponse(content={"status": "success", "started": started, "results": results}, status_code=200)
+
+@app.post("/initiate-conference")
+async def initiate_conference(request: Request):
+    """Start a conference between several participants, each speaking their own language.
+
+    Body: {"participants": [{"phone_number", "language", optional "tts_provider", "voice"}, ...],
+    optional "speculative_translation", "glossary"}
+    """
+    try:
+        body = await request.json()
+        participants = body["participants"]
+    except Exception:
+        body, participants = {}, None
+    if not isinstance(participants, list) or not 2 <= len(participants) <= BULK_MAX_SESSIONS:
+        return JSONResponse(content={"status": "error", "message": f"Expected a JSON body with 2 to {BULK_MAX_SESSIONS} participants"},
+                            status_code=400)
+    for index, participant in enumerate(participants):
+        error = json_fields_error(participant, ("phone_number", "language"), ("tts_provider", "voice"))
+        if error:
+            return JSONResponse(content={"status": "error", "message": f"Participant {index + 1}: {error}"},
+                                status_code=400)
+    error = json_fields_error(body, (), flags=("speculative_translation",))
+    if error:
+        return JSONResponse(content={"status": "error", "message": error}, status_code=400)
+
+    try:
+        glossary = parse_glossary(body.get("glossary"))
+    except ValueError as e:
+        return JSONResponse(content={"status": "error", "message": f"Invalid glossary: {e}"}, status_code=400)
+
+    if worker_drain.draining:
+        return JSONResponse(content={"status": "error", "message": "This server is restarting, please try again shortly"},
+                            status_code=503, headers={"Retry-After": "5"})
+    if llm_scheduler.saturated():
+        sessions_rejected_total.inc()
+        return JSONResponse(content={"status": "error", "message": "The service is busy, please try again shortly"},
+                            status_code=503, headers={"Retry-After": "5"})
+
+    session = await create_conference_session(request.headers.get('host'), participants,
+                                        body.get("speculative_translation", SPECULATIVE_TRANSLATION), glossary)
+    call_sids = await dial_conference(session)
+    started = sum(1 for call_sid in call_sids.values() if call_sid)
+    return JSONResponse(content={
+        "status": "success" if started >= 2 else "error",
+        "session_id": session.session_id,
+        "participants": {participant_id: {"phone_number": session.participants[participant_id]["phone_number"],
+                                          "language": session.participants[participant_id]["language"],
+                                          "call_sid": call_sid}
+                         for participant_id, call_sid in call_sids.items()},
+    }, status_code=200)
+
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8080)
\ No newline at end of file
@@ -0,0 +1,246 @@
+"""Replay recorded sessions through the translation engine without placing calls.
+
+Reads the per-session transcripts written by main.py (TRANSCRIPT_DIR) and sends
+every utterance through translate_text_streaming, keeping each session's turn
+order and pauses (divided by --speedup). Each --config is run in turn and
+reported with time to first token, turn latency, tokens and cost (from the
+provider's usage report where it sends one, else litellm's tokenizer count);
+--output writes every replayed turn as JSONL for diffing between runs.
+
+    python replay.py transcripts/ --concurrency 10 --speedup 20 --fake
+    python replay.py transcripts/ --config '{"name": "nano"}' \\
+        --config '{"name": "mini", "backends": [{"name": "mini", "model": "azure/gpt-4.1-mini", ...}]}'
+"""
+import os
+import json
+import gzip
+import time
+import random
+import asyncio
+import logging
+import argparse
+import contextvars
+from typing import Dict, List, Optional
+
+import litellm
+
+import main
+from bench import FakeLLM, percentile
+
+class ReplayConfig:
+    """One engine configuration to replay the recorded traffic against"""
+    def __init__(self, name: str = "default", backends: Optional[List[dict]] = None, context: bool = True,
+                 coalesce: bool = main.TOKEN_COALESCING, max_chars: int = main.COALESCE_MAX_CHARS,
+                 max_delay_ms: float = main.COALESCE_MAX_DELAY * 1000):
+        self.name = name
+        self.backends = backends or main.TRANSLATION_BACKENDS
+        self.context = context  # Send the rolling conversation context like a live session
+        self.coalesce = coalesce
+        self.max_chars = max_chars
+        self.max_delay = max_delay_ms / 1000
+
+class TurnResult:
+    def __init__(self, session_id: str, index: int, turn: dict):
+        self.session_id = session_id
+        self.index = index
+        self.turn = turn
+        self.translation = ""
+        self.first_token: Optional[float] = None
+        self.latency: Optional[float] = None
+        self.chunks = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.usage_reported = False  # Token counts come from the provider, not the tokenizer
+        self.request: Optional[dict] = None  # Model and messages of the last LLM call, for the tokenizer
+        self.error = ""
+
+    def to_json(self, config: ReplayConfig) -> dict:
+        return {
+            "config": config.name,
+            "session_id": self.session_id,
+            "index": self.index,
+            "source_language": self.turn["source_language"],
+            "target_language": self.turn["target_language"],
+            "original": self.turn["original"],
+            "recorded_translation": self.turn["translation"],
+            "translation": self.translation,
+            "first_token_ms": round(self.first_token * 1000, 1) if self.first_token is not None else None,
+            "latency_ms": round(self.latency * 1000, 1) if self.latency is not None else None,
+            "chunks": self.chunks,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "tokens_from": "usage" if self.usage_reported else "token_counter",
+            "error": self.error,
+        }
+
+def load_sessions(paths: List[str]) -> Dict[str, List[dict]]:
+    """Return completed turns per session from transcript files or directories"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files += sorted(os.path.join(path, name) for name in os.listdir(path) if name.endswith(".jsonl.gz"))
+        else:
+            files.append(path)
+    sessions = {}
+    for path in files:
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            records = [json.loads(line) for line in f if line.strip()]
+        turns = [record for record in records if record["event"] == "turn" and not record.get("cancelled")]
+        if turns:
+            sessions[os.path.basename(path).split(".")[0]] = turns
+    return sessions
+
+def token_costs(model: str, input_cost: Optional[float], output_cost: Optional[float]):
+    """Return (input, output) USD per token, from the flags or litellm's price table"""
+    prices = litellm.model_cost.get(model) or litellm.model_cost.get(model.split("/", 1)[-1]) or {}
+    return (input_cost / 1e6 if input_cost is not None else prices.get("input_cost_per_token", 0.0),
+            output_cost / 1e6 if output_cost is not None else prices.get("output_cost_per_token", 0.0))
+
+# The turn whose LLM calls are being made, so their usage reports can be credited to it
+replayed_turn: contextvars.ContextVar[Optional[TurnResult]] = contextvars.ContextVar("replayed_turn", default=None)
+
+def report_usage(acompletion):
+    """Wrap acompletion to request the provider's token usage and credit it to the replayed turn"""
+    async def wrapper(**kwargs):
+        kwargs.setdefault("stream_options", {"include_usage": True})
+        result = replayed_turn.get()
+        if result is not None:
+            result.request = {"model": kwargs["model"], "messages": kwargs["messages"]}
+        stream = await acompletion(**kwargs)
+        return usage_chunks(stream, result)
+    return wrapper
+
+async def usage_chunks(stream, result: Optional[TurnResult]):
+    """Pass the stream's chunks through, adding the usage chunk's counts to `result`"""
+    try:
+        async for chunk in stream:
+            usage = getattr(chunk, "usage", None)
+            if usage and result is not None:
+                # Every stream that runs to the end is billed, hedges and retries included
+                result.prompt_tokens += usage.prompt_tokens
+                result.completion_tokens += usage.completion_tokens
+                result.usage_reported = True
+            yield chunk
+    finally:
+        await main.close_llm_stream(stream)
+
+async def replay_turn(result: TurnResult, config: ReplayConfig, context: Optional[main.ConversationContext]):
+    turn = result.turn
+    source_lang, target_lang = turn["source_language"], turn["target_language"]
+    replayed_turn.set(result)
+    started = time.perf_counter()
+    events = main.translate_text_streaming(turn["original"], source_lang, target_lang,
+                                           session_id=result.session_id, context=context)
+    if config.coalesce:
+        events = main.coalesce_tokens(events, config.max_chars, config.max_delay)
+    try:
+        async for event in events:
+            if event["token"]:
+                if result.first_token is None:
+                    result.first_token = time.perf_counter() - started
+                result.chunks += 1
+            result.translation += event["token"]
+    except Exception as e:
+        result.error = str(e)
+    result.latency = time.perf_counter() - started
+    result.translation = result.translation.strip()
+    if not result.usage_reported and result.request:
+        # No usage report (fake LLM, provider without stream_options): count with the model's tokenizer
+        result.prompt_tokens = litellm.token_counter(**result.request)
+        result.completion_tokens = litellm.token_counter(model=result.request["model"], text=result.translation)
+    if context is not None and not result.error:
+        context.append(source_lang, turn["original"], result.translation)
+
+async def replay_session(session_id: str, turns: List[dict], config: ReplayConfig, speedup: float,
+                         semaphore: asyncio.Semaphore) -> List[TurnResult]:
+    context = main.ConversationContext() if config.context else None
+    results = []
+    async with semaphore:
+        for index, turn in enumerate(turns):
+            if index and speedup > 0:
+                # Keep the recorded pause between utterances, compressed
+                await asyncio.sleep(max(0.0, turn["time"] - turns[index - 1]["time"]) / speedup)
+            result = TurnResult(session_id, index, turn)
+            await replay_turn(result, config, context)
+            results.append(result)
+    return results
+
+async def run_config(config: ReplayConfig, sessions: Dict[str, List[dict]], args) -> List[TurnResult]:
+    main.backend_router = main.BackendRouter(config.backends)
+    semaphore = asyncio.Semaphore(args.concurrency)
+    started = time.perf_counter()
+    per_session = await asyncio.gather(*(replay_session(session_id, turns, config, args.speedup, semaphore)
+                                         for session_id, turns in sessions.items()))
+    elapsed = time.perf_counter() - started
+    results = [result for session_results in per_session for result in session_results]
+
+    ok = [result for result in results if not result.error]
+    reported = sum(1 for result in results if result.usage_reported)
+    prompt_tokens = sum(result.prompt_tokens for result in results)
+    completion_tokens = sum(result.completion_tokens for result in results)
+    input_cost, output_cost = token_costs(config.backends[0]["model"], args.input_cost, args.output_cost)
+    first_token = [result.first_token for result in ok if result.first_token is not None]
+    latency = [result.latency for result in ok]
+    changed = sum(1 for result in ok if result.translation != result.turn["translation"].strip())
+
+    print(f"== {config.name} ({config.backends[0]['model']})")
+    print(f"turns replayed:      {len(results)} in {elapsed:.1f}s ({len(results) - len(ok)} failed)")
+    print(f"first token p50/p99: {percentile(first_token, 50) * 1000:.1f} / {percentile(first_token, 99) * 1000:.1f} ms")
+    print(f"latency p50/p99:     {percentile(latency, 50) * 1000:.1f} / {percentile(latency, 99) * 1000:.1f} ms")
+    if reported == len(results):
+        source = "provider usage"
+    elif reported:
+        source = f"provider usage for {reported}/{len(results)} turns, the rest estimated with litellm.token_counter"
+    else:
+        source = "estimated with litellm.token_counter"
+    print(f"tokens in/out:       {prompt_tokens} / {completion_tokens} ({source})")
+    print(f"cost:                ${prompt_tokens * input_cost + completion_tokens * output_cost:.4f}")
+    print(f"differs from record: {changed}/{len(ok)} turns")
+    return results
+
+async def run_replay(args):
+    sessions = load_sessions(args.transcripts)
+    if args.sessions:
+        sessions = dict(list(sessions.items())[:args.sessions])
+    if not sessions:
+        raise SystemExit("No recorded turns found")
+    if args.fake:
+        main.acompletion = FakeLLM(args.token_rate, args.jitter, args.ttft).acompletion
+    main.acompletion = report_usage(main.acompletion)
+
+    configs = [ReplayConfig(**json.loads(config)) for config in args.config] or [ReplayConfig()]
+    output = open(args.output, "w", encoding="utf-8") if args.output else None
+    try:
+        for config in configs:
+            for result in await run_config(config, sessions, args):
+                if output:
+                    output.write(json.dumps(result.to_json(config), ensure_ascii=False) + "\n")
+    finally:
+        if output:
+            output.close()
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("transcripts", nargs="+", help="Transcript files or directories")
+    parser.add_argument("--config", action="append", default=[],
+                        help='JSON engine configuration, repeatable: {"name", "backends", "context", '
+                             '"coalesce", "max_chars", "max_delay_ms"}')
+    parser.add_argument("--concurrency", type=int, default=10, help="Sessions replayed at once")
+    parser.add_argument("--speedup", type=float, default=10.0, help="Divide recorded pauses by this; 0 skips them")
+    parser.add_argument("--sessions", type=int, default=0, help="Replay only the first N sessions")
+    parser.add_argument("--output", help="Write every replayed turn to this JSONL file")
+    parser.add_argument("--input-cost", type=float, help="USD per million prompt tokens (default: litellm prices)")
+    parser.add_argument("--output-cost", type=float, help="USD per million completion tokens (default: litellm prices)")
+    parser.add_argument("--fake", action="store_true", help="Use the local fake LLM instead of the real backends")
+    parser.add_argument("--token-rate", type=float, default=50.0, help="Fake LLM tokens per second")
+    parser.add_argument("--ttft", type=float, default=0.25, help="Fake LLM time to first token in seconds")
+    parser.add_argument("--jitter", type=float, default=0.2, help="Relative random variation of fake LLM delays")
+    parser.add_argument("--seed", type=int, default=1)
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    random.seed(arguments.seed)
+    logging.getLogger().setLevel(os.getenv("REPLAY_LOG_LEVEL", "WARNING"))
+    asyncio.run(run_replay(arguments))
@@ -1 +1 @@
-gunicorn -w 4 -k uvicorn.workers.UvicornWorker main:app --bind=0.0.0.0:$PORT
\ No newline at end of file
+SESSION_STORE=${SESSION_STORE:-sqlite} gunicorn -w 4 -k uvicorn.workers.UvicornWorker main:app --bind=0.0.0.0:$PORT --graceful-timeout $((${DRAIN_TIMEOUT:-300} + 30))
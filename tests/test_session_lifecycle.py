@@ -0,0 +1,84 @@
+"""Lifecycle deadlines of sessions shared between workers through the SQLite store."""
+import os
+import time
+
+import pytest
+
+os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+
+import main
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def workers(tmp_path, monkeypatch):
+    """Three workers' stores on one database; the reaper under test runs on the first"""
+    path = str(tmp_path / "sessions.db")
+    stores = [main.SqliteSessionStore(path) for _ in range(3)]
+    monkeypatch.setattr(main, "translation_sessions", stores[0])
+    return stores
+
+
+async def move(store, session_id, state):
+    """Transition a session as another worker would"""
+    session = await store.get(session_id)
+    session.state = state
+    session.state_changed_at = time.time()
+    await store.save(session, "state", "state_changed_at")
+
+
+def reaped(monkeypatch):
+    calls = []
+    monkeypatch.setattr(main, "spawn_background", lambda coro: (calls.append(coro), coro.close()))
+    return calls
+
+
+async def test_creating_worker_follows_state_set_elsewhere(workers, monkeypatch):
+    creator, other, _ = workers
+    session = main.TranslationSession("s1", "")
+    await creator.add(session)
+    lifecycle = main.SessionLifecycle(main.SESSION_DEADLINES)
+    await lifecycle.transition(session, "dialing")
+    await move(other, "s1", "active")
+
+    calls = reaped(monkeypatch)
+    await lifecycle._expire("s1", "dialing")
+
+    assert calls == []
+    assert lifecycle.state("s1") == "active"
+    assert await creator.get("s1")
+
+
+async def test_leg_holder_follows_peer_joining_elsewhere(workers, monkeypatch):
+    holder, _, third = workers
+    session = main.TranslationSession("s2", "")
+    await holder.add(session)
+    await holder.attach_websocket(session, "source", object())
+    lifecycle = main.SessionLifecycle(main.SESSION_DEADLINES)
+    await lifecycle.transition(session, "waiting")
+    await move(third, "s2", "active")
+
+    calls = reaped(monkeypatch)
+    await lifecycle._expire("s2", "waiting")
+
+    assert calls == []
+    assert lifecycle.state("s2") == "active"
+
+
+async def test_session_still_in_its_state_is_reaped(workers, monkeypatch):
+    creator = workers[0]
+    session = main.TranslationSession("s3", "")
+    await creator.add(session)
+    lifecycle = main.SessionLifecycle(main.SESSION_DEADLINES)
+    await lifecycle.transition(session, "dialing")
+
+    calls = reaped(monkeypatch)
+    await lifecycle._expire("s3", "dialing")
+
+    assert len(calls) == 1